@@ -93,7 +93,8 @@ def generate_maze(width: int, height: int, seed: Optional[int] = None) -> Maze:
     if seed is None:
         seed = random.randint(1, 999999)
     
-    random.seed(seed)
+    # 用独立的随机数生成器，其他线程同时使用全局 random 也不会打乱同一种子的迷宫
+    rng = random.Random(seed)
     
     # 初始化网格
     maze = Maze(width=width, height=height, seed=seed)
@@ -125,7 +126,7 @@ def generate_maze(width: int, height: int, seed: Optional[int] = None) -> Maze:
         
         if unvisited_neighbors:
             # 随机选择一个邻居
-            next_cell, direction = random.choice(unvisited_neighbors)
+            next_cell, direction = rng.choice(unvisited_neighbors)
             
             # 打通墙壁
             current.walls[direction] = False
@@ -145,7 +146,7 @@ def generate_maze(width: int, height: int, seed: Optional[int] = None) -> Maze:
             cell = maze.grid[y][x]
             if cell.opening_count() >= 3:
                 # 30% 概率标记为决策节点
-                if random.random() < 0.3:
+                if rng.random() < 0.3:
                     cell.decision_node = True
                     decision_nodes.append((x, y))
     
@@ -155,7 +156,7 @@ def generate_maze(width: int, height: int, seed: Optional[int] = None) -> Maze:
             (x, y) for y in range(height) for x in range(width)
             if maze.grid[y][x].opening_count() >= 2 and not maze.grid[y][x].decision_node
         ]
-        random.shuffle(candidates)
+        rng.shuffle(candidates)
         for x, y in candidates[:5 - len(decision_nodes)]:
             maze.grid[y][x].decision_node = True
     
@@ -1,7 +1,7 @@
 """Data models (Pydantic) for game state and history."""
 
 from typing import Optional, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ValueDimensions(BaseModel):
@@ -13,6 +13,15 @@ class ValueDimensions(BaseModel):
     responsibility: int = Field(default=0, ge=-999, le=999, description="Responsibility score")
     independence: int = Field(default=0, ge=-999, le=999, description="Independence score")
 
+    def is_zero(self) -> bool:
+        return (
+            self.empathy == 0
+            and self.integrity == 0
+            and self.courage == 0
+            and self.responsibility == 0
+            and self.independence == 0
+        )
+
     def add_delta(self, delta: "ValueDimensions") -> "ValueDimensions":
         return ValueDimensions(
             empathy=self.empathy + delta.empathy,
@@ -32,6 +41,14 @@ class Question(BaseModel):
     difficulty: float = Field(default=0.5, ge=0.0, le=1.0, description="Difficulty 0~1")
     tags: Optional[list[str]] = Field(default=None, description="Topic tags")
 
+    _tag_set: Optional[frozenset] = PrivateAttr(default=None)
+
+    def tag_set(self) -> frozenset:
+        """Lower-cased tags, normalized once per question."""
+        if self._tag_set is None:
+            self._tag_set = frozenset(t.lower() for t in (self.tags or []))
+        return self._tag_set
+
 
 class Answer(BaseModel):
     """Player answer."""
@@ -3,14 +3,20 @@
 处理游戏存档的读写
 """
 
+import hashlib
 import os
-import json
 from typing import Optional
 from pathlib import Path
 from .models import SaveData
 from .state import GameState
 
 
+# 已确认存在的存档目录，避免每次保存都 mkdir
+_ensured_dirs: set[Path] = set()
+# 每个存档路径最近一次写出内容的摘要，内容未变时跳过写盘
+_last_digests: dict[str, bytes] = {}
+
+
 def ensure_save_dir(save_path: str) -> None:
     """确保存档目录存在
     
@@ -18,7 +24,10 @@ def ensure_save_dir(save_path: str) -> None:
         save_path: 存档文件路径
     """
     save_dir = Path(save_path).parent
+    if save_dir in _ensured_dirs:
+        return
     save_dir.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(save_dir)
 
 
 def load_save(save_path: str) -> Optional[SaveData]:
@@ -30,13 +39,11 @@ def load_save(save_path: str) -> Optional[SaveData]:
     Returns:
         SaveData 对象，如果不存在则返回 None
     """
-    if not os.path.exists(save_path):
-        return None
-    
     try:
-        with open(save_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return SaveData.model_validate(data)
+        with open(save_path, "rb") as f:
+            return SaveData.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"加载存档失败: {e}")
         return None
@@ -53,14 +60,46 @@ def save_now(state: GameState, save_path: str) -> bool:
         是否保存成功
     """
     try:
-        ensure_save_dir(save_path)
         save_data = state.to_save_data()
+    except Exception as e:
+        print(f"保存存档失败: {e}")
+        return False
+    return write_save(save_data, save_path)
+
+
+def write_save(save_data: SaveData, save_path: str) -> bool:
+    """把已生成的存档快照写入磁盘
+    
+    快照可以在持锁时生成，序列化和写盘则放到锁外进行。
+    
+    Args:
+        save_data: 存档快照
+        save_path: 存档文件路径
+        
+    Returns:
+        是否保存成功
+    """
+    try:
+        ensure_save_dir(save_path)
+        # 不在这里暂停 GC：gc.disable() 作用于整个进程，存档线程开关它会和 uvicorn 的请求线程互相干扰
+        # pydantic-core 直接序列化为 JSON 字节，省去 model_dump + json.dump 两趟遍历
+        payload = save_data.model_dump_json(indent=2).encode("utf-8")
+        
+        digest = hashlib.blake2b(payload).digest()
+        if _last_digests.get(save_path) == digest and os.path.exists(save_path):
+            return True
         
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(save_data.model_dump(), f, ensure_ascii=False, indent=2)
+        # 先写临时文件再替换，避免写到一半时留下损坏的存档
+        tmp_path = f"{save_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, save_path)
+        _last_digests[save_path] = digest
         
         return True
     except Exception as e:
+        # 目录可能被外部删除，下次保存时重新创建
+        _ensured_dirs.discard(Path(save_path).parent)
         print(f"保存存档失败: {e}")
         return False
 
@@ -75,6 +114,7 @@ def delete_save(save_path: str) -> bool:
         是否删除成功
     """
     try:
+        _last_digests.pop(save_path, None)
         if os.path.exists(save_path):
             os.remove(save_path)
         return True
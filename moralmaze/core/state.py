@@ -1,13 +1,136 @@
 """Global game state management."""
 
-from typing import Optional
+from typing import Iterable, Optional
+import sys
 import time
 from .models import DecisionRecord, SaveData, ValueDimensions, GrowthRecord
 from .rules import compute_stage_by_age, Stage
 
 
+class SortedCoordSet(set):
+    """Set of (x, y) coordinates that memoizes its sorted order.
+
+    Payloads emit coordinates sorted for UI stability; the sorted list is
+    rebuilt only after the set changes.
+    """
+
+    __slots__ = ("_sorted_cache",)
+
+    def __init__(self, coords: Iterable[tuple[int, int]] = ()):
+        super().__init__(coords)
+        self._sorted_cache: Optional[list[tuple[int, int]]] = None
+
+    def sorted(self) -> list[tuple[int, int]]:
+        """Sorted coordinates (cached; treat as read-only)."""
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self)
+        return self._sorted_cache
+
+    def add(self, coord: tuple[int, int]) -> None:
+        if coord not in self:
+            super().add(coord)
+            self._sorted_cache = None
+
+    def discard(self, coord: tuple[int, int]) -> None:
+        if coord in self:
+            super().discard(coord)
+            self._sorted_cache = None
+
+    def remove(self, coord: tuple[int, int]) -> None:
+        super().remove(coord)
+        self._sorted_cache = None
+
+    def pop(self) -> tuple[int, int]:
+        coord = super().pop()
+        self._sorted_cache = None
+        return coord
+
+    def clear(self) -> None:
+        super().clear()
+        self._sorted_cache = None
+
+    def update(self, *others) -> None:
+        super().update(*others)
+        self._sorted_cache = None
+
+    def difference_update(self, *others) -> None:
+        super().difference_update(*others)
+        self._sorted_cache = None
+
+    def intersection_update(self, *others) -> None:
+        super().intersection_update(*others)
+        self._sorted_cache = None
+
+    def symmetric_difference_update(self, other) -> None:
+        super().symmetric_difference_update(other)
+        self._sorted_cache = None
+
+    def __ior__(self, other):
+        self._sorted_cache = None
+        return super().__ior__(other)
+
+    def __iand__(self, other):
+        self._sorted_cache = None
+        return super().__iand__(other)
+
+    def __isub__(self, other):
+        self._sorted_cache = None
+        return super().__isub__(other)
+
+    def __ixor__(self, other):
+        self._sorted_cache = None
+        return super().__ixor__(other)
+
+
 class GameState:
-    """Holds the full game state."""
+    """Holds the full game state.
+
+    Fields are declared in ``__slots__``; optional fields missing from old
+    saves are filled in by the controller (``STATE_FIELD_DEFAULTS``).
+    """
+
+    __slots__ = (
+        "age",
+        "stage",
+        "history",
+        "seed",
+        "total_growth",
+        "hero_health",
+        "_value_dimensions",
+        "_value_dimensions_dump",
+        "growth_history",
+        "jump_charges",
+        "jump_bonus_awarded",
+        "ally_jump_charges",
+        "ally_last_jump_bonus_ts",
+        "ally_freeze_charges",
+        "ally_freeze_initial_bonus_awarded",
+        "ally_freeze_last_bonus_ts",
+        "ally_expand_charges",
+        "ally_expand_initial_bonus_awarded",
+        "ally_expand_last_bonus_ts",
+        "ally_lift_charges",
+        "ally_lift_initial_bonus_awarded",
+        "ally_lift_last_bonus_ts",
+        "ally_dissolve_charges",
+        "ally_dissolve_max_charges",
+        "ally_dissolve_last_bonus_ts",
+        "dissolved_nodes",
+        "ally_blink_charges",
+        "ally_blink_last_bonus_ts",
+        "ally_position",
+        "ally_trap_charges",
+        "ally_trap_last_bonus_ts",
+        "traps",
+        "hero_escape_charges",
+        "hero_escape_last_age",
+        "shield_charges",
+        "shield_last_age",
+        "shield_active_until",
+        "_active_decisions",
+        "current_position",
+        "visited_nodes",
+    )
 
     def __init__(self, save_data: Optional[SaveData] = None):
         if save_data:
@@ -46,7 +169,7 @@ class GameState:
             self.traps = getattr(save_data, "traps", []) or []
             self.hero_escape_charges = getattr(save_data, "hero_escape_charges", 0)
             self.hero_escape_last_age = getattr(save_data, "hero_escape_last_age", 0)
-            self.active_decisions: set[tuple[int, int]] = set(
+            self.active_decisions = SortedCoordSet(
                 tuple(pair) for pair in getattr(save_data, "active_decisions", []) or []
             )
         else:
@@ -79,7 +202,7 @@ class GameState:
             self.traps: list[dict] = []
             self.hero_escape_charges = 0
             self.hero_escape_last_age = 0
-            self.active_decisions: set[tuple[int, int]] = set()
+            self.active_decisions = SortedCoordSet()
 
         if self.ally_last_jump_bonus_ts is None:
             self.ally_last_jump_bonus_ts = time.time()
@@ -109,8 +232,35 @@ class GameState:
         new_stage = compute_stage_by_age(self.age)
         self.stage = new_stage
 
+    @property
+    def active_decisions(self) -> SortedCoordSet:
+        return self._active_decisions
+
+    @active_decisions.setter
+    def active_decisions(self, coords: Iterable[tuple[int, int]]) -> None:
+        if not isinstance(coords, SortedCoordSet):
+            coords = SortedCoordSet(coords)
+        self._active_decisions = coords
+
+    @property
+    def value_dimensions(self) -> ValueDimensions:
+        return self._value_dimensions
+
+    @value_dimensions.setter
+    def value_dimensions(self, value: ValueDimensions) -> None:
+        self._value_dimensions = value
+        self._value_dimensions_dump: Optional[dict] = None
+
+    def value_dimensions_dump(self) -> dict:
+        """Cached ``model_dump()`` of the five-value state (treat as read-only)."""
+        if self._value_dimensions_dump is None:
+            self._value_dimensions_dump = self._value_dimensions.model_dump()
+        return self._value_dimensions_dump
+
     def apply_value_delta(self, delta: ValueDimensions) -> None:
         """Apply five-value delta to current state."""
+        if delta.is_zero():
+            return
         self.value_dimensions = self.value_dimensions.add_delta(delta)
 
     def append_decision(self, record: DecisionRecord) -> None:
@@ -177,6 +327,34 @@ class GameState:
 class Settings:
     """Game settings."""
 
+    __slots__ = (
+        "window_width",
+        "window_height",
+        "fps",
+        "title",
+        "maze_width",
+        "maze_height",
+        "maze_seed",
+        "start_age",
+        "goal_age",
+        "ai_provider",
+        "ai_sensitivity",
+        "save_path",
+        "color_background",
+        "color_wall",
+        "color_player",
+        "color_decision_node",
+        "color_path",
+        "color_text",
+        "color_button",
+        "color_button_hover",
+        "server_host",
+        "server_port",
+        "auto_open_browser",
+        "static_root",
+        "server_debug",
+    )
+
     def __init__(self):
         # Window
         self.window_width = 960
@@ -215,6 +393,8 @@ class Settings:
         self.server_port = 8000
         self.auto_open_browser = True
         self.static_root = "./web/astray"
+        # 调试时才打开 uvicorn 的逐请求访问日志
+        self.server_debug = False
 
     def load_from_dict(self, config: dict) -> None:
         if "window" in config:
@@ -237,7 +417,8 @@ class Settings:
 
         if "ai" in config:
             ai = config["ai"]
-            self.ai_provider = ai.get("provider", self.ai_provider)
+            # 统一转小写并驻留，选择 provider 时直接查表
+            self.ai_provider = sys.intern(str(ai.get("provider", self.ai_provider)).lower())
             self.ai_sensitivity = ai.get("sensitivity", self.ai_sensitivity)
 
         if "save" in config:
@@ -263,3 +444,4 @@ class Settings:
             self.server_port = srv.get("port", self.server_port)
             self.auto_open_browser = srv.get("auto_open_browser", self.auto_open_browser)
             self.static_root = srv.get("static_root", self.static_root)
+            self.server_debug = srv.get("debug", self.server_debug)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import List, Optional, Literal, Type
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -90,9 +91,14 @@ def create_app(
     controller: GameController,
     *,
     static_dir: Optional[Path] = None,
+    default_response_class: Type[Response] = JSONResponse,
 ) -> FastAPI:
     """构建 FastAPI 实例并注入控制器。"""
-    app = FastAPI(title="Moral Maze Web API", version="1.0.0")
+    app = FastAPI(
+        title="Moral Maze Web API",
+        version="1.0.0",
+        default_response_class=default_response_class,
+    )
     app.state.controller = controller
 
     # 允许前端直接请求
@@ -102,6 +108,8 @@ def create_app(
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # 迷宫/时间线等较大的 JSON 压缩后再发送
+    app.add_middleware(GZipMiddleware, minimum_size=512)
 
     @app.get("/api/ping")
     async def ping():
@@ -6,9 +6,10 @@ Clean ASCII version to avoid encoding issues.
 
 from __future__ import annotations
 
+import heapq
 import random
 import threading
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import time
 
 from ..ai.provider_base import AIProvider
@@ -20,6 +21,7 @@ from ..core.models import (
     DecisionRecord,
     Question,
     Review,
+    SaveData,
     ValueDimensions,
     GrowthRecord,
 )
@@ -34,6 +36,8 @@ DIR_TO_DELTA = {
     "west": (-1, 0),
 }
 
+DELTA_TO_DIR = {delta: direction for direction, delta in DIR_TO_DELTA.items()}
+
 OPPOSITE_DIRECTION = {
     "north": "south",
     "south": "north",
@@ -41,10 +45,147 @@ OPPOSITE_DIRECTION = {
     "west": "east",
 }
 
+# Hero offsets (relative to ally) a lift can grab: same tile, or same row/column within 2 tiles
+LIFT_OFFSETS = frozenset(
+    {(1, 0), (-1, 0), (2, 0), (-2, 0), (0, 1), (0, -1), (0, 2), (0, -2), (0, 0)}
+)
+
+# Ally blink targets: tiles within manhattan distance 3 of the hero (excluding the hero tile)
+BLINK_OFFSETS = tuple(
+    (dx, dy)
+    for dx in range(-3, 4)
+    for dy in range(-3, 4)
+    if 0 < abs(dx) + abs(dy) <= 3
+)
+
+# ValueDimensions fields, in model order; a question tag with the same name targets that field
+VALUE_DIMENSION_KEYS = ("empathy", "integrity", "courage", "responsibility", "independence")
+VALUE_DIMENSION_TAGS = frozenset(VALUE_DIMENSION_KEYS)
+
+# Default feedback voices; formatted with the chosen answer and the value-delta summary
+VOICE_TEMPLATES = {
+    "parents": "We see you chose {ans}. Hold to your principles and care for others—grow with grace. [{delta}]",
+    "friend": "Bold pick! Let’s keep it real and kind. We’ve got your back. [{delta}]",
+    "future_self": "This step shapes who you become—balance heart and spine. Keep learning. [{delta}]",
+}
+# Voice keys required before/after age 60, matched positionally to generic provider roles
+YOUNG_VOICE_KEYS = ("parents", "friend", "future_self")
+OLD_VOICE_KEYS = ("child", "friend", "past_self")
+VOICE_ROLE_KEYS = ("role1", "role2", "role3")
+DELTA_SUMMARY_TEMPLATE = "E{empathy:+} I{integrity:+} Cg{courage:+} R{responsibility:+} In{independence:+}"
+
+# Writes requested within this window are coalesced into one save
+SAVE_DEBOUNCE_SECONDS = 0.1
+# Back-off before retrying a save that failed
+SAVE_RETRY_SECONDS = 1.0
+
+# Defaults for state fields that older saves/states may lack; applied once per state
+STATE_FIELD_DEFAULTS: Dict[str, Callable[[], object]] = {
+    "hero_health": lambda: 100,
+    "jump_charges": lambda: 2,
+    "jump_bonus_awarded": lambda: 0,
+    "ally_jump_charges": lambda: 2,
+    "ally_last_jump_bonus_ts": time.time,
+    "ally_freeze_charges": lambda: 0,
+    "ally_freeze_initial_bonus_awarded": lambda: False,
+    "ally_freeze_last_bonus_ts": time.time,
+    "ally_expand_charges": lambda: 0,
+    "ally_expand_initial_bonus_awarded": lambda: False,
+    "ally_expand_last_bonus_ts": time.time,
+    "ally_lift_charges": lambda: 0,
+    "ally_lift_initial_bonus_awarded": lambda: False,
+    "ally_lift_last_bonus_ts": time.time,
+    "ally_dissolve_charges": lambda: 1,
+    "ally_dissolve_max_charges": lambda: 2,
+    "ally_dissolve_last_bonus_ts": time.time,
+    "dissolved_nodes": dict,
+    "ally_blink_charges": lambda: 1,
+    "ally_blink_last_bonus_ts": time.time,
+    "ally_position": lambda: None,
+    "ally_trap_charges": lambda: 1,
+    "ally_trap_last_bonus_ts": time.time,
+    "traps": list,
+    # at least one escape by default so the hero can break free early-game
+    "hero_escape_charges": lambda: 1,
+    "hero_escape_last_age": lambda: 0,
+    "shield_charges": lambda: 1,
+    "shield_last_age": lambda: 0,
+    "shield_active_until": lambda: None,
+    "active_decisions": set,
+}
+
+
+def refill_charges(
+    charges: int,
+    last_ts: Optional[float],
+    now: float,
+    *,
+    interval: float,
+    cap: int,
+    per_cycle: int = 1,
+) -> Tuple[int, float]:
+    """Regain per_cycle charges for every full interval since last_ts; returns (charges, last_ts)."""
+    if last_ts is None:
+        return charges, now
+    cycles = int((now - last_ts) // interval)
+    if cycles <= 0:
+        return charges, last_ts
+    return min(cap, max(0, charges) + cycles * per_cycle), last_ts + cycles * interval
+
+
+def refill_charges_after_bonus(
+    charges: int,
+    last_ts: Optional[float],
+    bonus_awarded: bool,
+    now: float,
+    *,
+    delay: float,
+    bonus: int,
+    interval: float,
+    cap: int,
+    per_cycle: int = 1,
+) -> Tuple[int, float, bool]:
+    """Like refill_charges, but a one-off bonus arrives after delay before regular refills start."""
+    if last_ts is None:
+        return charges, now, bonus_awarded
+    if not bonus_awarded:
+        if now - last_ts < delay:
+            return charges, last_ts, False
+        return min(cap, max(0, charges) + bonus), now, True
+    charges, last_ts = refill_charges(
+        charges, last_ts, now, interval=interval, cap=cap, per_cycle=per_cycle
+    )
+    return charges, last_ts, True
+
 
 class GameController:
     """Wrap game flow and provide data to the web layer."""
 
+    __slots__ = (
+        "settings",
+        "state",
+        "maze",
+        "ai_provider",
+        "hero_frozen",
+        "_rng",
+        "_lock",
+        "_save_dirty",
+        "_save_cond",
+        "_save_stop",
+        "_save_thread",
+        "_save_seq",
+        "_written_seq",
+        "_write_lock",
+        "_active_questions",
+        "_timeline_records",
+        "_timeline_growth",
+        "_life_summary_cache",
+        "_trap_expiry",
+        "_dissolve_heap",
+        "_wall_grid",
+        "_grid_size",
+    )
+
     def __init__(
         self,
         *,
@@ -57,142 +198,143 @@ class GameController:
         self.state = state
         self.maze = maze
         self.ai_provider = ai_provider
+        # private generator seeded like the maze, so a seed still reproduces the same run
+        self._rng = random.Random(maze.seed)
+        # server-side frozen indicator, cleared when the hero escapes
+        self.hero_frozen = False
 
-        if not getattr(self.state, "current_position", None):
+        self._ensure_state_fields()
+        if not self.state.current_position:
             self.state.current_position = self.maze.start_pos
 
         # active decision coords (tuples)
-        if not hasattr(self.state, "active_decisions"):
-            self.state.active_decisions = set()
         if not self.state.active_decisions:
             self._init_active_decisions()
 
-        self._lock = threading.Lock()
+        # re-entrant so flush_save() can run from inside locked sections
+        self._lock = threading.RLock()
+        self._save_dirty = False
+        self._save_cond = threading.Condition()
+        self._save_stop = threading.Event()
+        # snapshots are numbered under _lock; a write never replaces a newer snapshot on disk
+        self._save_seq = 0
+        self._written_seq = 0
+        # serializes disk writes, which happen outside _lock
+        self._write_lock = threading.Lock()
         self._active_questions: Dict[str, Question] = {}
+        # history/growth_history are append-only; only new entries get serialized
+        self._timeline_records: List[dict] = []
+        self._timeline_growth: List[dict] = []
+        self._life_summary_cache: Optional[Tuple[int, str]] = None
+        # min-heap of trap expiry timestamps; entries may be stale (trap already gone)
+        self._trap_expiry: List[float] = []
+        self._rebuild_trap_expiry()
+        # (restore_at, coord) heap mirroring state.dissolved_nodes
+        self._dissolve_heap: List[Tuple[float, Tuple[int, int]]] = []
+        self._rebuild_dissolve_heap()
 
         # Build wall grid for Astray renderer
         self._wall_grid, self._grid_size = self._build_wall_grid()
-        self._sync_jump_charges_with_state()
-        self._sync_ally_state()
-        self._sync_freeze_state()
-        self._sync_expand_state()
-        self._replenish_lift_charges()
-        self._replenish_lift_charges()
-        self._sync_dissolve_state()
-        self._replenish_dissolve_charges()
-        self._expire_dissolved_nodes()
-        self._sync_trap_state()
-        self._replenish_trap_charges()
-        self._expire_traps()
-        self._sync_blink_state()
-        self._replenish_blink_charges()
-        self._sync_escape_state()
-        self._sync_shield_state()
+        self._sync_all(time.time())
+
+        self._save_thread = threading.Thread(
+            target=self._save_worker, name="save-writer", daemon=True
+        )
+        self._save_thread.start()
 
     # ------------------------------------------------------------------
     # Public accessors
     # ------------------------------------------------------------------
     def get_state_payload(self) -> dict:
         """State payload for HUD/UI."""
-        self._replenish_ally_jump_charges()
-        self._replenish_freeze_charges()
-        self._replenish_expand_charges()
-        self._replenish_lift_charges()
-        self._replenish_dissolve_charges()
-        self._expire_dissolved_nodes()
-        self._replenish_trap_charges()
-        self._expire_traps()
-        self._sync_shield_state()
-        freeze_state = {
-            "charges": getattr(self.state, "ally_freeze_charges", 0),
-            "initial_delay": 10,
-            "interval": 30,
-            "initial_granted": getattr(
-                self.state, "ally_freeze_initial_bonus_awarded", False
-            ),
-            "max_charges": 3,
-        }
-        expand_state = {
-            "charges": getattr(self.state, "ally_expand_charges", 0),
-            "initial_delay": 10,
-            "interval": 20,
-            "initial_granted": getattr(
-                self.state, "ally_expand_initial_bonus_awarded", False
-            ),
-            "burst_amount": 2,
-            "max_charges": 5,
-            "restore_duration": 20,
-        }
-        dissolve_state = {
-            "charges": getattr(self.state, "ally_dissolve_charges", 1),
-            "interval": 15,
-            "max_charges": getattr(self.state, "ally_dissolve_max_charges", 2),
-            "active": [
-                {"x": x, "y": y, "restore_at": ts}
-                for (x, y), ts in getattr(self.state, "dissolved_nodes", {}).items()
-            ],
-        }
-        lift_state = {
-            "charges": getattr(self.state, "ally_lift_charges", 0),
-            "initial_delay": 0,
-            "interval": 20,
-            "initial_granted": getattr(
-                self.state, "ally_lift_initial_bonus_awarded", False
-            ),
-            "max_charges": 2,
-        }
-        trap_state = {
-            "charges": getattr(self.state, "ally_trap_charges", 0),
-            "interval": 20,
-            "max_charges": 2,
-            "traps": getattr(self.state, "traps", []),
-        }
-        shield_state = {
-            "charges": getattr(self.state, "shield_charges", 0),
-            "active_until": getattr(self.state, "shield_active_until", None),
-            "duration": 10,
-        }
-        return {
-            "age": self.state.age,
-            "stage": self.state.stage,
-            "stage_name": get_stage_name_en(self.state.stage),
-            "total_growth": self.state.total_growth,
-            "hero_health": getattr(self.state, "hero_health", 100),
-            "shield": shield_state,
-            "hero_escape_charges": getattr(self.state, "hero_escape_charges", 0),
-            "value_dimensions": self.state.value_dimensions.model_dump(),
-            "goal_age": self.settings.goal_age,
-            "ai_provider": self.ai_provider.name,
-            "current_position": {
-                "x": self.state.current_position[0],
-                "y": self.state.current_position[1],
-            },
-            "ally_position": self.state.ally_position
-            if getattr(self.state, "ally_position", None)
-            else None,
-            "active_decisions": [
-                {"x": x, "y": y} for (x, y) in sorted(self.state.active_decisions)
-            ],
-            "has_progress": self._has_progress(),
-            "jump_charges": getattr(self.state, "jump_charges", 0),
-            "ally_state": {
-                "jump_charges": getattr(self.state, "ally_jump_charges", 0),
-                "recharge_interval": 120,
-                "freeze": freeze_state,
-                "expand": expand_state,
-                "dissolve": dissolve_state,
-                "lift": lift_state,
-                "blink": {
-                    "charges": getattr(self.state, "ally_blink_charges", 1),
-                    "interval": 20,
-                    "max_charges": 2,
+        with self._lock:
+            state = self.state
+            self._sync_all(time.time())
+            freeze_state = {
+                "charges": state.ally_freeze_charges,
+                "initial_delay": 10,
+                "interval": 30,
+                "initial_granted": state.ally_freeze_initial_bonus_awarded,
+                "max_charges": 3,
+            }
+            expand_state = {
+                "charges": state.ally_expand_charges,
+                "initial_delay": 10,
+                "interval": 20,
+                "initial_granted": state.ally_expand_initial_bonus_awarded,
+                "burst_amount": 2,
+                "max_charges": 5,
+                "restore_duration": 20,
+            }
+            dissolve_state = {
+                "charges": state.ally_dissolve_charges,
+                "interval": 15,
+                "max_charges": state.ally_dissolve_max_charges,
+                "active": [
+                    {"x": x, "y": y, "restore_at": ts}
+                    for (x, y), ts in state.dissolved_nodes.items()
+                ],
+            }
+            lift_state = {
+                "charges": state.ally_lift_charges,
+                "initial_delay": 0,
+                "interval": 20,
+                "initial_granted": state.ally_lift_initial_bonus_awarded,
+                "max_charges": 2,
+            }
+            trap_state = {
+                "charges": state.ally_trap_charges,
+                "interval": 20,
+                "max_charges": 2,
+                "traps": state.traps,
+            }
+            shield_state = {
+                "charges": state.shield_charges,
+                "active_until": state.shield_active_until,
+                "duration": 10,
+            }
+            return {
+                "age": state.age,
+                "stage": state.stage,
+                "stage_name": get_stage_name_en(state.stage),
+                "total_growth": state.total_growth,
+                "hero_health": state.hero_health,
+                "shield": shield_state,
+                "hero_escape_charges": state.hero_escape_charges,
+                "value_dimensions": state.value_dimensions_dump(),
+                "goal_age": self.settings.goal_age,
+                "ai_provider": self.ai_provider.name,
+                "current_position": {
+                    "x": state.current_position[0],
+                    "y": state.current_position[1],
                 },
-                "trap": trap_state,
-            },
-        }
+                "ally_position": state.ally_position,
+                "active_decisions": [
+                    {"x": x, "y": y} for (x, y) in state.active_decisions.sorted()
+                ],
+                "has_progress": self._has_progress(),
+                "jump_charges": state.jump_charges,
+                "ally_state": {
+                    "jump_charges": state.ally_jump_charges,
+                    "recharge_interval": 120,
+                    "freeze": freeze_state,
+                    "expand": expand_state,
+                    "dissolve": dissolve_state,
+                    "lift": lift_state,
+                    "blink": {
+                        "charges": state.ally_blink_charges,
+                        "interval": 20,
+                        "max_charges": 2,
+                    },
+                    "trap": trap_state,
+                },
+            }
 
     def get_maze_payload(self) -> dict:
         """Serialized maze for the frontend renderer."""
+        rows = self.maze.grid
+        visited = self.state.visited_nodes
+        dissolved = self.state.dissolved_nodes
         cells = [
             {
                 "x": cell.x,
@@ -200,19 +342,19 @@ class GameController:
                 "walls": cell.walls,
                 "decision_node": cell.decision_node,
             }
-            for row in self.maze.grid
+            for row in rows
             for cell in row
         ]
         decision_nodes = [
             {
                 "x": cell.x,
                 "y": cell.y,
-                "visited": (cell.x, cell.y) in self.state.visited_nodes,
+                "visited": (cell.x, cell.y) in visited,
             }
-            for row in self.maze.grid
+            for row in rows
             for cell in row
             if cell.decision_node
-            and (cell.x, cell.y) not in getattr(self.state, "dissolved_nodes", {})
+            and (cell.x, cell.y) not in dissolved
         ]
 
         return {
@@ -223,9 +365,9 @@ class GameController:
             "cells": cells,
             "decision_nodes": decision_nodes,
             "active_decisions": [
-                {"x": x, "y": y} for (x, y) in sorted(self.state.active_decisions)
+                {"x": x, "y": y} for (x, y) in self.state.active_decisions.sorted()
             ],
-            "traps": self._visible_traps_payload(),
+            "traps": self._visible_traps_payload(time.time()),
             "wall_grid": self._wall_grid,
             "grid_size": {"width": self._grid_size[0], "height": self._grid_size[1]},
         }
@@ -235,26 +377,28 @@ class GameController:
             new_state = GameState()
             new_state.age = self.settings.start_age
             new_state.stage = compute_stage_by_age(new_state.age)
-            seed = random.randint(1, 999_999)
+            seed = self._rng.randint(1, 999_999)
             self.maze = generate_maze(
                 width=self.settings.maze_width,
                 height=self.settings.maze_height,
                 seed=seed,
             )
             new_state.seed = self.maze.seed
+            self._rng.seed(self.maze.seed)
             new_state.current_position = self.maze.start_pos
             new_state.ally_position = (min(self.maze.width - 1, self.maze.start_pos[0] + 1), self.maze.start_pos[1])
-        self.state = new_state
-        self._wall_grid, self._grid_size = self._build_wall_grid()
-        self._sync_jump_charges_with_state()
-        self._sync_ally_state()
-        self._sync_freeze_state()
-        self._sync_expand_state()
-        self._replenish_lift_charges()
-        self._sync_escape_state()
-        self._init_active_decisions()
-        save.save_now(self.state, self.settings.save_path)
-        return self.get_state_payload(), self.get_maze_payload()
+            self.state = new_state
+            self._ensure_state_fields()
+            self._rebuild_trap_expiry()
+            self._rebuild_dissolve_heap()
+            self._timeline_records = []
+            self._timeline_growth = []
+            self._life_summary_cache = None
+            self._wall_grid, self._grid_size = self._build_wall_grid()
+            self._sync_all(time.time())
+            self._init_active_decisions()
+            self.flush_save()
+            return self.get_state_payload(), self.get_maze_payload()
 
     def place_trap(self, trap_type: str, x: int, y: int) -> dict:
         """Place a hidden trap (mine/medkit) at the given coordinates (ally position)."""
@@ -262,16 +406,16 @@ class GameController:
         if trap_type not in {"mine", "medkit"}:
             raise ValueError("invalid trap type")
         with self._lock:
-            self._replenish_trap_charges()
-            charges = getattr(self.state, "ally_trap_charges", 0)
+            now = time.time()
+            self._replenish_trap_charges(now)
+            charges = self.state.ally_trap_charges
             if charges <= 0:
                 raise ValueError("No trap charges left")
             if not (0 <= x < self.maze.width and 0 <= y < self.maze.height):
                 raise ValueError("Out of bounds")
             # remove existing trap on same tile
-            traps = getattr(self.state, "traps", [])
+            traps = self.state.traps
             traps = [t for t in traps if not (t.get("x") == x and t.get("y") == y)]
-            now = time.time()
             trap = {
                 "type": trap_type,
                 "x": x,
@@ -282,30 +426,29 @@ class GameController:
             }
             traps.append(trap)
             self.state.traps = traps
+            heapq.heappush(self._trap_expiry, trap["expires_at"])
             self.state.ally_trap_charges = charges - 1
             self.state.ally_trap_last_bonus_ts = now
-            save.save_now(self.state, self.settings.save_path)
+            self._mark_dirty()
             return {
                 "remaining_charges": self.state.ally_trap_charges,
-                "traps": self._visible_traps_payload(),
-                "hero_health": getattr(self.state, "hero_health", 100),
+                "traps": self._visible_traps_payload(now),
+                "hero_health": self.state.hero_health,
             }
 
     def move_player(self, target_x: int, target_y: int) -> dict:
         """Attempt to move player; return validity and decision trigger."""
         with self._lock:
-            self._expire_traps()
+            self._expire_traps(time.time())
             current_x, current_y = self.state.current_position
-            dx = target_x - current_x
-            dy = target_y - current_y
-            if abs(dx) + abs(dy) != 1:
+            direction = DELTA_TO_DIR.get((target_x - current_x, target_y - current_y))
+            if direction is None:
                 return {
                     "valid": False,
                     "position": {"x": current_x, "y": current_y},
                     "reason": "invalid_step",
                 }
 
-            direction = self._direction_from_delta(dx, dy)
             current_cell = self.maze.get_cell(current_x, current_y)
             next_cell = self.maze.get_cell(target_x, target_y)
             if not current_cell or not next_cell:
@@ -340,7 +483,7 @@ class GameController:
                 "decision_node": decision_required,
                 "visited_before": not first_visit if decision_required else False,
                 "trap_event": trap_event,
-                "hero_health": getattr(self.state, "hero_health", 100),
+                "hero_health": self.state.hero_health,
             }
 
     def apply_wall_mutations(self, mutations: List[dict]) -> dict:
@@ -353,8 +496,6 @@ class GameController:
             for mutation in mutations:
                 if self._apply_wall_mutation(mutation):
                     applied = True
-            if applied:
-                self._wall_grid, self._grid_size = self._build_wall_grid()
         return {"applied": applied}
 
     def jump_player(self, direction: str) -> dict:
@@ -363,18 +504,18 @@ class GameController:
             return {
                 "success": False,
                 "reason": "invalid_direction",
-                "remaining_charges": getattr(self.state, "jump_charges", 0),
+                "remaining_charges": self.state.jump_charges,
             }
         direction = direction.lower()
         if direction not in DIR_TO_DELTA:
             return {
                 "success": False,
                 "reason": "invalid_direction",
-                "remaining_charges": getattr(self.state, "jump_charges", 0),
+                "remaining_charges": self.state.jump_charges,
             }
 
         with self._lock:
-            charges = getattr(self.state, "jump_charges", 0)
+            charges = self.state.jump_charges
             if charges <= 0:
                 return {
                     "success": False,
@@ -398,7 +539,7 @@ class GameController:
                     "remaining_charges": charges,
                 }
 
-            target_x, target_y, distance = random.choice(candidates)
+            target_x, target_y, distance = self._rng.choice(candidates)
             target_cell = self.maze.get_cell(target_x, target_y)
             if not target_cell:
                 return {
@@ -415,7 +556,7 @@ class GameController:
             if decision_required:
                 first_visit = self.state.mark_node_visited(target_x, target_y)
 
-            save.save_now(self.state, self.settings.save_path)
+            self._mark_dirty()
 
             return {
                 "success": True,
@@ -434,7 +575,7 @@ class GameController:
             if not (0 <= target_x < self.maze.width and 0 <= target_y < self.maze.height):
                 raise ValueError("out_of_bounds")
             self.state.current_position = (target_x, target_y)
-            save.save_now(self.state, self.settings.save_path)
+            self._mark_dirty()
             return {"position": {"x": target_x, "y": target_y}, "state": self.get_state_payload()}
 
     def start_decision(self, x: int, y: int) -> dict:
@@ -462,7 +603,7 @@ class GameController:
             print(f"[Provider] question generation failed, using local scenario. ({e})")
             scenario_list = scenario_store.pick_for_stage(current_stage)
             if scenario_list:
-                chosen = random.choice(scenario_list)
+                chosen = self._rng.choice(scenario_list)
                 question = Question(
                     id=chosen["id"],
                     prompt=chosen["prompt"],
@@ -473,7 +614,7 @@ class GameController:
             else:
                 # ultimate fallback: simple mock question
                 question = Question(
-                    id=f"local_{current_stage}_{random.randint(1000,9999)}",
+                    id=f"local_{current_stage}_{self._rng.randint(1000,9999)}",
                     prompt="A friend asks you to break a rule to help them. What do you do?",
                     options=["Refuse", "Accept", "Seek help"],
                     difficulty=0.5,
@@ -488,20 +629,18 @@ class GameController:
     def start_lift(self, hero: tuple[int, int], ally: tuple[int, int]) -> dict:
         """Begin lift: verify distance, consume charge, return allowed info."""
         with self._lock:
-            self._replenish_lift_charges()
-            charges = getattr(self.state, "ally_lift_charges", 0)
+            now = time.time()
+            self._replenish_lift_charges(now)
+            charges = self.state.ally_lift_charges
             if charges <= 0:
                 raise ValueError("No lift charges left")
             hx, hy = hero
             ax, ay = ally
-            dx = hx - ax
-            dy = hy - ay
-            # Only allow straight-line grabs (same row or column) within 2 tiles
-            if not ((dy == 0 and abs(dx) <= 2) or (dx == 0 and abs(dy) <= 2)):
+            if (hx - ax, hy - ay) not in LIFT_OFFSETS:
                 raise ValueError("Out of reach – ally boost whiffs")
             self.state.ally_lift_charges = max(0, charges - 1)
-            self.state.ally_lift_last_bonus_ts = time.time()
-            save.save_now(self.state, self.settings.save_path)
+            self.state.ally_lift_last_bonus_ts = now
+            self._mark_dirty()
             return {
                 "ok": True,
                 "remaining_charges": self.state.ally_lift_charges,
@@ -515,7 +654,7 @@ class GameController:
         # Always throw hero from ally tile (blue -> yellow)
         ax, ay = ally
         dx, dy = DIR_TO_DELTA[direction]
-        dist = random.choice((2, 3))
+        dist = self._rng.choice((2, 3))
         tx = ax + dx * dist
         ty = ay + dy * dist
         in_bounds = 0 <= tx < self.maze.width and 0 <= ty < self.maze.height
@@ -538,7 +677,10 @@ class GameController:
                 self.state.hero_health = 0
                 decision_required = False
                 first_visit = False
-            save.save_now(self.state, self.settings.save_path)
+            if hero_dead:
+                self.flush_save()
+            else:
+                self._mark_dirty()
             return {
                 "position": {"x": target[0], "y": target[1]},
                 "roll_direction": direction,
@@ -546,28 +688,30 @@ class GameController:
                 "decision_node": decision_required,
                 "visited_before": (not first_visit) if decision_required else False,
                 "hero_dead": hero_dead,
-                "hero_health": getattr(self.state, "hero_health", 0),
+                "hero_health": self.state.hero_health,
                 "state": self.get_state_payload(),
             }
 
     def dissolve_node(self, x: int, y: int) -> dict:
         """Dissolve a decision node temporarily."""
         with self._lock:
-            self._replenish_dissolve_charges()
-            charges = getattr(self.state, "ally_dissolve_charges", 0)
+            now = time.time()
+            self._replenish_dissolve_charges(now)
+            charges = self.state.ally_dissolve_charges
             if charges <= 0:
                 raise ValueError("No dissolve charges left")
             if (x, y) not in self.state.active_decisions and (x, y) not in self.state.decision_nodes:
                 raise ValueError("Not a decision node")
-            restore_at = time.time() + 15
-            dissolved = getattr(self.state, "dissolved_nodes", {})
+            restore_at = now + 15
+            dissolved = self.state.dissolved_nodes
             dissolved[(x, y)] = restore_at
             self.state.dissolved_nodes = dissolved
+            heapq.heappush(self._dissolve_heap, (restore_at, (x, y)))
             self.state.ally_dissolve_charges = charges - 1
-            self.state.ally_dissolve_last_bonus_ts = time.time()
+            self.state.ally_dissolve_last_bonus_ts = now
             # temporarily remove from active_decisions
             self.state.active_decisions.discard((x, y))
-            save.save_now(self.state, self.settings.save_path)
+            self._mark_dirty()
             return {
                 "ok": True,
                 "remaining_charges": self.state.ally_dissolve_charges,
@@ -638,72 +782,145 @@ class GameController:
             self._grant_jump_bonus_if_needed()
             self._grant_escape_by_age()
             self._grant_shield_bonus_if_needed()
-            save.save_now(self.state, self.settings.save_path)
+            game_complete = self.state.is_goal_reached(self.settings.goal_age)
+            if game_complete:
+                self.flush_save()
+            else:
+                self._mark_dirty()
 
         return {
             "question": self._serialize_question(stored_question),
             "answer": self._serialize_answer(answer, stored_question),
             "review": self._serialize_review(review),
             "value_delta": value_delta.model_dump(),
-            "value_dimensions": self.state.value_dimensions.model_dump(),
+            "value_dimensions": self.state.value_dimensions_dump(),
             "voices": voices,
             "state": self.get_state_payload(),
-            "game_complete": self.state.is_goal_reached(self.settings.goal_age),
+            "game_complete": game_complete,
         }
 
     def get_timeline_payload(self) -> dict:
         """Return decision history payload for recap."""
-        records = [
-            {
-                "index": idx + 1,
-                "age": record.age_at_decision,
-                "stage": record.stage_at_decision,
-                "stage_name": get_stage_name_en(record.stage_at_decision),
-                "question": self._serialize_question(record.question),
-                "answer": self._serialize_answer(record.answer, record.question),
-                "review": self._serialize_review(record.review),
+        with self._lock:
+            records = self._timeline_records
+            history = self.state.history
+            for idx in range(len(records), len(history)):
+                record = history[idx]
+                records.append(
+                    {
+                        "index": idx + 1,
+                        "age": record.age_at_decision,
+                        "stage": record.stage_at_decision,
+                        "stage_name": get_stage_name_en(record.stage_at_decision),
+                        "question": self._serialize_question(record.question),
+                        "answer": self._serialize_answer(record.answer, record.question),
+                        "review": self._serialize_review(record.review),
+                    }
+                )
+            growth = self._timeline_growth
+            growth_history = self.state.growth_history
+            for rec in growth_history[len(growth):]:
+                growth.append(
+                    {
+                        "question_id": rec.question_id,
+                        "prompt": rec.prompt,
+                        "age": rec.age,
+                        "stage": rec.stage,
+                        "value_delta": rec.value_delta.model_dump(),
+                        "perspectives": rec.perspectives,
+                        "notes": rec.notes,
+                    }
+                )
+            # summary inputs only change when a decision is submitted
+            decisions = len(history)
+            if self._life_summary_cache is None or self._life_summary_cache[0] != decisions:
+                self._life_summary_cache = (decisions, self._build_life_summary())
+            return {
+                "summary": {
+                    "final_age": self.state.age,
+                    "stage": self.state.stage,
+                    "stage_name": get_stage_name_en(self.state.stage),
+                    "total_growth": self.state.total_growth,
+                    "value_dimensions": self.state.value_dimensions_dump(),
+                    "decisions": decisions,
+                    "narrative": self._life_summary_cache[1],
+                },
+                # copies, so callers cannot corrupt the incremental caches
+                "records": list(records),
+                "growth_history": list(growth),
             }
-            for idx, record in enumerate(self.state.history)
-        ]
-        return {
-            "summary": {
-                "final_age": self.state.age,
-                "stage": self.state.stage,
-                "stage_name": get_stage_name_en(self.state.stage),
-                "total_growth": self.state.total_growth,
-                "value_dimensions": self.state.value_dimensions.model_dump(),
-                "decisions": len(self.state.history),
-                "narrative": self._build_life_summary(),
-            },
-            "records": records,
-            "growth_history": [
-                {
-                    "question_id": rec.question_id,
-                    "prompt": rec.prompt,
-                    "age": rec.age,
-                    "stage": rec.stage,
-                    "value_delta": rec.value_delta.model_dump(),
-                    "perspectives": rec.perspectives,
-                    "notes": rec.notes,
-                }
-                for rec in getattr(self.state, "growth_history", [])
-            ],
-        }
+
+    def flush_save(self) -> bool:
+        """Write the current state to disk now (end-of-life transitions)."""
+        with self._lock:
+            seq, snapshot = self._take_snapshot()
+        return self._write_snapshot(seq, snapshot)
+
+    def close(self) -> bool:
+        """Stop the save worker and write whatever is still pending (shutdown)."""
+        with self._save_cond:
+            self._save_stop.set()
+            self._save_cond.notify()
+        self._save_thread.join()
+        return self.flush_save()
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _direction_from_delta(self, dx: int, dy: int) -> str:
-        if dx == 1:
-            return "east"
-        if dx == -1:
-            return "west"
-        if dy == 1:
-            return "south"
-        return "north"
+    def _mark_dirty(self) -> None:
+        """Schedule a save; bursts of mutations are written once by the save worker."""
+        with self._save_cond:
+            self._save_dirty = True
+            self._save_cond.notify()
+
+    def _take_snapshot(self) -> Tuple[int, SaveData]:
+        """Capture the state for saving; the caller holds _lock."""
+        with self._save_cond:
+            self._save_dirty = False
+        self._save_seq += 1
+        return self._save_seq, self.state.to_save_data()
+
+    def _write_snapshot(self, seq: int, snapshot: SaveData) -> bool:
+        """Serialize and write a snapshot without holding _lock."""
+        with self._write_lock:
+            if seq < self._written_seq:
+                # a newer snapshot is already on disk
+                return True
+            saved = save.write_save(snapshot, self.settings.save_path)
+            if saved:
+                self._written_seq = seq
+            else:
+                # leave it to the save worker to retry
+                self._mark_dirty()
+            return saved
+
+    def _save_worker(self) -> None:
+        cond = self._save_cond
+        stop = self._save_stop
+        while True:
+            with cond:
+                while not self._save_dirty and not stop.is_set():
+                    cond.wait()
+            # debounce, but wake up at once on close()
+            if stop.wait(SAVE_DEBOUNCE_SECONDS):
+                return
+            with self._lock:
+                with cond:
+                    if not self._save_dirty:
+                        continue
+                seq, snapshot = self._take_snapshot()
+            if not self._write_snapshot(seq, snapshot) and stop.wait(SAVE_RETRY_SECONDS):
+                return
+
+    def _ensure_state_fields(self) -> None:
+        """Set any missing state field to its default so hot paths can read it directly."""
+        state = self.state
+        for name, factory in STATE_FIELD_DEFAULTS.items():
+            if not hasattr(state, name):
+                setattr(state, name, factory())
 
     def _apply_trap_trigger(self, x: int, y: int) -> Optional[dict]:
-        traps = getattr(self.state, "traps", [])
+        traps = self.state.traps
         hit_index = None
         for idx, trap in enumerate(traps):
             if trap.get("x") == x and trap.get("y") == y:
@@ -713,16 +930,16 @@ class GameController:
             return None
         trap = traps.pop(hit_index)
         self.state.traps = traps
-        roll = random.random()
+        roll = self._rng.random()
         damage_main = trap.get("type") == "mine"
         heal_main = trap.get("type") == "medkit"
         effect = "damage" if (damage_main and roll < 0.8) or (heal_main and roll >= 0.8) else "heal"
         amount = 30 if effect == "damage" else 20
         shield_active = False
-        active_until = getattr(self.state, "shield_active_until", None)
+        active_until = self.state.shield_active_until
         if active_until and active_until > time.time():
             shield_active = True
-        current = getattr(self.state, "hero_health", 100)
+        current = self.state.hero_health
         if not shield_active:
             if effect == "damage":
                 current = max(0, current - amount)
@@ -742,82 +959,86 @@ class GameController:
     def apply_freeze_hit(self, damage_percent: float | None = None) -> dict:
         """Apply a small health penalty when the ally freeze succeeds."""
         with self._lock:
-            self._sync_trap_state()
+            self._grant_shield_bonus_if_needed()
             percent = 5.0 if damage_percent is None else max(0.0, float(damage_percent))
             damage = max(1, int(round(100 * (percent / 100.0))))
-            current = getattr(self.state, "hero_health", 100)
+            current = self.state.hero_health
             new_health = max(0, current - damage)
             self.state.hero_health = new_health
-            save.save_now(self.state, self.settings.save_path)
+            if new_health <= 0:
+                self.flush_save()
+            else:
+                self._mark_dirty()
             return {"hero_health": new_health, "damage": damage}
 
     def escape_hero(self, x: int | None = None, y: int | None = None) -> dict:
         """Hero escapes freeze or lift grab if possible, and can optionally snap to provided cell."""
-        self._grant_escape_by_age()
-        charges = getattr(self.state, "hero_escape_charges", 0)
-        if charges <= 0:
-            raise ValueError("No escape charges")
-        self.state.hero_escape_charges = charges - 1
-        # Optional reposition to keep server/client in sync when breaking free from lift
-        if x is not None and y is not None:
-            if 0 <= x < self.maze.width and 0 <= y < self.maze.height:
-                self.state.current_position = (x, y)
-        # reset server-side frozen indicator if present
-        if hasattr(self, "hero_frozen"):
+        with self._lock:
+            self._grant_escape_by_age()
+            charges = self.state.hero_escape_charges
+            if charges <= 0:
+                raise ValueError("No escape charges")
+            self.state.hero_escape_charges = charges - 1
+            # Optional reposition to keep server/client in sync when breaking free from lift
+            if x is not None and y is not None:
+                if 0 <= x < self.maze.width and 0 <= y < self.maze.height:
+                    self.state.current_position = (x, y)
             self.hero_frozen = False
-        save.save_now(self.state, self.settings.save_path)
-        return {
-            "remaining_charges": self.state.hero_escape_charges,
-            "hero_frozen": False,
-            "position": {
-                "x": self.state.current_position[0],
-                "y": self.state.current_position[1],
-            },
-        }
+            self._mark_dirty()
+            return {
+                "remaining_charges": self.state.hero_escape_charges,
+                "hero_frozen": False,
+                "position": {
+                    "x": self.state.current_position[0],
+                    "y": self.state.current_position[1],
+                },
+            }
 
     def activate_shield(self) -> dict:
         """Activate hero shield for a limited time."""
-        self._grant_shield_bonus_if_needed()
-        charges = getattr(self.state, "shield_charges", 0)
-        if charges <= 0:
-            raise ValueError("No shield charges")
-        duration = 10
-        self.state.shield_charges = charges - 1
-        self.state.shield_active_until = time.time() + duration
-        save.save_now(self.state, self.settings.save_path)
-        return {
-            "remaining_charges": self.state.shield_charges,
-            "active_until": self.state.shield_active_until,
-            "duration": duration,
-        }
+        with self._lock:
+            self._grant_shield_bonus_if_needed()
+            charges = self.state.shield_charges
+            if charges <= 0:
+                raise ValueError("No shield charges")
+            duration = 10
+            self.state.shield_charges = charges - 1
+            self.state.shield_active_until = time.time() + duration
+            self._mark_dirty()
+            return {
+                "remaining_charges": self.state.shield_charges,
+                "active_until": self.state.shield_active_until,
+                "duration": duration,
+            }
 
     def blink_ally(self) -> dict:
         """Teleport ally near hero within 3 tiles (manhattan)."""
-        self._replenish_blink_charges()
-        charges = getattr(self.state, "ally_blink_charges", 0)
-        if charges <= 0:
-            raise ValueError("No blink charges left")
-        hx, hy = self.state.current_position
-        candidates = []
-        for dx in range(-3, 4):
-            for dy in range(-3, 4):
-                if abs(dx) + abs(dy) == 0 or abs(dx) + abs(dy) > 3:
-                    continue
-                tx, ty = hx + dx, hy + dy
-                if 0 <= tx < self.maze.width and 0 <= ty < self.maze.height:
-                    if self.maze.get_cell(tx, ty):
-                        candidates.append((tx, ty))
-        if not candidates:
-            raise ValueError("No valid blink target")
-        target = random.choice(candidates)
-        self.state.ally_position = target
-        self.state.ally_blink_charges = charges - 1
-        self.state.ally_blink_last_bonus_ts = time.time()
-        save.save_now(self.state, self.settings.save_path)
-        return {
-            "position": {"x": target[0], "y": target[1]},
-            "remaining_charges": self.state.ally_blink_charges,
-        }
+        with self._lock:
+            now = time.time()
+            self._replenish_blink_charges(now)
+            charges = self.state.ally_blink_charges
+            if charges <= 0:
+                raise ValueError("No blink charges left")
+            hx, hy = self.state.current_position
+            width = self.maze.width
+            height = self.maze.height
+            # every in-bounds tile is a cell, so bounds are the only filter
+            candidates = [
+                (hx + dx, hy + dy)
+                for dx, dy in BLINK_OFFSETS
+                if 0 <= hx + dx < width and 0 <= hy + dy < height
+            ]
+            if not candidates:
+                raise ValueError("No valid blink target")
+            target = self._rng.choice(candidates)
+            self.state.ally_position = target
+            self.state.ally_blink_charges = charges - 1
+            self.state.ally_blink_last_bonus_ts = now
+            self._mark_dirty()
+            return {
+                "position": {"x": target[0], "y": target[1]},
+                "remaining_charges": self.state.ally_blink_charges,
+            }
 
     def _serialize_question(self, question: Question) -> dict:
         return {
@@ -850,26 +1071,11 @@ class GameController:
         self, question: Question, review: Review, answer: Answer
     ) -> ValueDimensions:
         base = max(-2, min(2, int(review.growth_delta)))
-        tags = {t.lower() for t in (question.tags or [])}
-
-        def bump(flag: bool) -> int:
-            if base > 0 and flag:
-                return min(2, base)
-            if base < 0 and flag:
-                return max(-2, base)
-            return 0
-
+        hits = question.tag_set() & VALUE_DIMENSION_TAGS
+        if hits:
+            return ValueDimensions(**dict.fromkeys(hits, base))
         # Default bias if no tags matched
-        vd = ValueDimensions(
-            empathy=bump("empathy" in tags),
-            integrity=bump("integrity" in tags),
-            courage=bump("courage" in tags),
-            responsibility=bump("responsibility" in tags),
-            independence=bump("independence" in tags),
-        )
-        if all(getattr(vd, k) == 0 for k in vd.model_fields):
-            vd.responsibility = base
-        return vd
+        return ValueDimensions(responsibility=base)
 
     def _build_voices(
         self, question: Question, answer: Answer, value_delta: ValueDimensions
@@ -879,15 +1085,16 @@ class GameController:
             if 0 <= answer.choice_id < len(question.options):
                 choice_text = question.options[answer.choice_id]
         ans = answer.free_text or choice_text or "your move"
-        delta_summary = (
-            f"E{value_delta.empathy:+} I{value_delta.integrity:+} "
-            f"Cg{value_delta.courage:+} R{value_delta.responsibility:+} "
-            f"In{value_delta.independence:+}"
+        delta_summary = DELTA_SUMMARY_TEMPLATE.format(
+            empathy=value_delta.empathy,
+            integrity=value_delta.integrity,
+            courage=value_delta.courage,
+            responsibility=value_delta.responsibility,
+            independence=value_delta.independence,
         )
         return {
-            "parents": f"We see you chose {ans}. Hold to your principles and care for others—grow with grace. [{delta_summary}]",
-            "friend": f"Bold pick! Let’s keep it real and kind. We’ve got your back. [{delta_summary}]",
-            "future_self": f"This step shapes who you become—balance heart and spine. Keep learning. [{delta_summary}]",
+            role: template.format(ans=ans, delta=delta_summary)
+            for role, template in VOICE_TEMPLATES.items()
         }
 
     def _build_default_voices(
@@ -912,185 +1119,158 @@ class GameController:
         provider_voices: dict | None,
         default_voices: dict,
     ) -> dict:
-        voices = provider_voices if isinstance(provider_voices, dict) else {}
-        normalized = dict(voices)
-        # map generic role keys if present
-        if "role1" in normalized or "role2" in normalized or "role3" in normalized:
-            roles = [normalized.get("role1"), normalized.get("role2"), normalized.get("role3")]
-            if age < 60:
-                normalized.setdefault("parents", roles[0] or "")
-                normalized.setdefault("friend", roles[1] or "")
-                normalized.setdefault("future_self", roles[2] or "")
-            else:
-                normalized.setdefault("child", roles[0] or "")
-                normalized.setdefault("friend", roles[1] or "")
-                normalized.setdefault("past_self", roles[2] or "")
-        if age < 60:
-            required = {
-                "parents": default_voices.get("parents", ""),
-                "friend": default_voices.get("friend", ""),
-                "future_self": default_voices.get("future_self", ""),
-            }
-        else:
-            required = {
-                "child": default_voices.get("child", ""),
-                "friend": default_voices.get("friend", ""),
-                "past_self": default_voices.get("past_self", ""),
-            }
-        for key, fallback in required.items():
-            if not normalized.get(key):
-                normalized[key] = fallback or ""
+        normalized = dict(provider_voices) if isinstance(provider_voices, dict) else {}
+        required = YOUNG_VOICE_KEYS if age < 60 else OLD_VOICE_KEYS
+        # explicit key first, then the generic role in the same slot, then the default
+        for key, role in zip(required, VOICE_ROLE_KEYS):
+            normalized[key] = (
+                normalized.get(key) or normalized.get(role) or default_voices.get(key, "")
+            )
         return normalized
 
-    def _sync_jump_charges_with_state(self) -> None:
-        if not hasattr(self.state, "jump_charges"):
-            self.state.jump_charges = 2
-        if not hasattr(self.state, "jump_bonus_awarded"):
-            self.state.jump_bonus_awarded = 0
-        self.state.jump_charges = max(0, self.state.jump_charges)
+    def _init_active_decisions(self) -> None:
+        """Initialize dynamic active decisions."""
+        visited = self.state.visited_nodes
+        width = self.maze.width
+        height = self.maze.height
+        total = width * height
+        if len(visited) * 2 <= total:
+            # mostly unvisited maze: draw random cells until 8 fresh ones turn up,
+            # without materializing the full candidate list
+            count = min(8, total - len(visited))
+            picks = set()
+            randrange = self._rng.randrange
+            while len(picks) < count:
+                y, x = divmod(randrange(total), width)
+                if (x, y) not in visited:
+                    picks.add((x, y))
+            self.state.active_decisions = picks
+            return
+        candidates = [
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if (x, y) not in visited
+        ]
+        count = min(8, len(candidates))
+        self.state.active_decisions = set(self._rng.sample(candidates, count))
+
+    def _sync_all(self, now: float) -> None:
+        """Bring every charge pool, timer and age-based grant up to date in one pass."""
+        state = self.state
+        state.jump_charges = max(0, state.jump_charges)
         self._grant_jump_bonus_if_needed()
+        self._grant_escape_by_age()
+        if state.ally_position is None:
+            # default spawn next to hero
+            hx, hy = state.current_position
+            state.ally_position = (min(self.maze.width - 1, hx + 1), hy)
 
-    def _sync_ally_state(self) -> None:
-        if not hasattr(self.state, "ally_jump_charges"):
-            self.state.ally_jump_charges = 2
-        if not hasattr(self.state, "ally_last_jump_bonus_ts"):
-            self.state.ally_last_jump_bonus_ts = time.time()
-        if self.state.ally_last_jump_bonus_ts is None:
-            self.state.ally_last_jump_bonus_ts = time.time()
-        self._replenish_ally_jump_charges()
-        self._sync_trap_state()
-
-    def _sync_trap_state(self) -> None:
-        if not hasattr(self.state, "hero_health"):
-            self.state.hero_health = 100
-        if not hasattr(self.state, "ally_trap_charges"):
-            self.state.ally_trap_charges = 1
-        if not hasattr(self.state, "ally_trap_last_bonus_ts"):
-            self.state.ally_trap_last_bonus_ts = time.time()
-        if not hasattr(self.state, "traps"):
-            self.state.traps = []
-        if self.state.ally_trap_last_bonus_ts is None:
-            self.state.ally_trap_last_bonus_ts = time.time()
-        self._grant_shield_bonus_if_needed()
+        state.ally_jump_charges, state.ally_last_jump_bonus_ts = refill_charges(
+            state.ally_jump_charges, state.ally_last_jump_bonus_ts, now, interval=15, cap=4
+        )
+        (
+            state.ally_freeze_charges,
+            state.ally_freeze_last_bonus_ts,
+            state.ally_freeze_initial_bonus_awarded,
+        ) = refill_charges_after_bonus(
+            state.ally_freeze_charges,
+            state.ally_freeze_last_bonus_ts,
+            state.ally_freeze_initial_bonus_awarded,
+            now,
+            delay=10,
+            bonus=2,
+            interval=30,
+            cap=3,
+        )
+        (
+            state.ally_expand_charges,
+            state.ally_expand_last_bonus_ts,
+            state.ally_expand_initial_bonus_awarded,
+        ) = refill_charges_after_bonus(
+            state.ally_expand_charges,
+            state.ally_expand_last_bonus_ts,
+            state.ally_expand_initial_bonus_awarded,
+            now,
+            delay=10,
+            bonus=2,
+            interval=20,
+            cap=5,
+            per_cycle=2,
+        )
+        self._replenish_lift_charges(now)
+        self._replenish_dissolve_charges(now)
+        self._replenish_trap_charges(now)
+        self._replenish_blink_charges(now)
+        self._expire_dissolved_nodes(now)
+        self._expire_traps(now)
 
-    def _sync_shield_state(self) -> None:
-        if not hasattr(self.state, "shield_charges"):
-            self.state.shield_charges = 1
-        if not hasattr(self.state, "shield_last_age"):
-            self.state.shield_last_age = 0
-        if not hasattr(self.state, "shield_active_until"):
-            self.state.shield_active_until = None
         # ensure at least 1 initial charge
-        self.state.shield_charges = max(1, self.state.shield_charges)
-        if self.state.shield_active_until and self.state.shield_active_until <= time.time():
-            self.state.shield_active_until = None
+        state.shield_charges = max(1, state.shield_charges)
+        if state.shield_active_until and state.shield_active_until <= now:
+            state.shield_active_until = None
         self._grant_shield_bonus_if_needed()
 
-    def _sync_blink_state(self) -> None:
-        if not hasattr(self.state, "ally_blink_charges"):
-            self.state.ally_blink_charges = 1
-        if not hasattr(self.state, "ally_blink_last_bonus_ts"):
-            self.state.ally_blink_last_bonus_ts = time.time()
-        if self.state.ally_blink_last_bonus_ts is None:
-            self.state.ally_blink_last_bonus_ts = time.time()
-        if not hasattr(self.state, "ally_position") or self.state.ally_position is None:
-            # default spawn next to hero
-            hx, hy = self.state.current_position
-            self.state.ally_position = (min(self.maze.width - 1, hx + 1), hy)
-
-    def _init_active_decisions(self) -> None:
-        """Initialize dynamic active decisions."""
-        candidates = []
-        for row in self.maze.grid:
-            for cell in row:
-                if (cell.x, cell.y) in getattr(self.state, "visited_nodes", set()):
-                    continue
-                candidates.append((cell.x, cell.y))
-        random.shuffle(candidates)
-        count = min(8, len(candidates))
-        self.state.active_decisions = set(candidates[:count])
-
-    def _sync_freeze_state(self) -> None:
-        if not hasattr(self.state, "ally_freeze_charges"):
-            self.state.ally_freeze_charges = 0
-        if not hasattr(self.state, "ally_freeze_initial_bonus_awarded"):
-            self.state.ally_freeze_initial_bonus_awarded = False
-        if not hasattr(self.state, "ally_freeze_last_bonus_ts"):
-            self.state.ally_freeze_last_bonus_ts = time.time()
-        if self.state.ally_freeze_last_bonus_ts is None:
-            self.state.ally_freeze_last_bonus_ts = time.time()
-        self._replenish_freeze_charges()
-
-    def _sync_expand_state(self) -> None:
-        if not hasattr(self.state, "ally_expand_charges"):
-            self.state.ally_expand_charges = 0
-        if not hasattr(self.state, "ally_expand_initial_bonus_awarded"):
-            self.state.ally_expand_initial_bonus_awarded = False
-        if not hasattr(self.state, "ally_expand_last_bonus_ts"):
-            self.state.ally_expand_last_bonus_ts = time.time()
-        if self.state.ally_expand_last_bonus_ts is None:
-            self.state.ally_expand_last_bonus_ts = time.time()
-        self._replenish_expand_charges()
-
-    def _sync_dissolve_state(self) -> None:
-        if not hasattr(self.state, "ally_dissolve_charges"):
-            self.state.ally_dissolve_charges = 1
-        if not hasattr(self.state, "ally_dissolve_last_bonus_ts"):
-            self.state.ally_dissolve_last_bonus_ts = time.time()
-        if not hasattr(self.state, "ally_dissolve_max_charges"):
-            self.state.ally_dissolve_max_charges = 2
-        if not hasattr(self.state, "dissolved_nodes"):
-            self.state.dissolved_nodes = {}
-        if self.state.ally_dissolve_last_bonus_ts is None:
-            self.state.ally_dissolve_last_bonus_ts = time.time()
-        self._expire_dissolved_nodes()
-        self._replenish_dissolve_charges()
-
     def set_active_decisions(self, coords: List[tuple[int, int]]) -> None:
         """Replace active decision coordinates (used by frontend sync)."""
+        width = self.maze.width
+        height = self.maze.height
         with self._lock:
-            filtered = []
-            for x, y in coords:
-                if 0 <= x < self.maze.width and 0 <= y < self.maze.height:
-                    filtered.append((x, y))
-            self.state.active_decisions = set(filtered)
-            save.save_now(self.state, self.settings.save_path)
+            self.state.active_decisions = {
+                (x, y) for x, y in coords if 0 <= x < width and 0 <= y < height
+            }
+            self._mark_dirty()
 
     def _grant_jump_bonus_if_needed(self) -> None:
         expected_bonus = max(0, (self.state.age - self.settings.start_age) // 5)
-        current_bonus = getattr(self.state, "jump_bonus_awarded", 0)
+        current_bonus = self.state.jump_bonus_awarded
         bonus_delta = expected_bonus - current_bonus
         if bonus_delta > 0:
-            self.state.jump_charges = max(0, getattr(self.state, "jump_charges", 0))
+            self.state.jump_charges = max(0, self.state.jump_charges)
             self.state.jump_charges += bonus_delta
             self.state.jump_bonus_awarded = expected_bonus
 
     def _build_wall_grid(self) -> Tuple[List[List[bool]], Tuple[int, int]]:
-        """Convert maze cell grid into Astray-friendly True/False grid."""
+        """Convert maze cell grid into Astray-friendly True/False grid.
+
+        Built column by column with slice assignments: even columns are the
+        vertical wall lines between cells, odd columns hold the cells (open)
+        and the horizontal walls between them. A wall slot is open when
+        either adjacent cell has that side open.
+        """
         width = self.maze.width
         height = self.maze.height
         grid_w = width * 2 + 1
         grid_h = height * 2 + 1
-
-        wall_grid: List[List[bool]] = [
-            [True for _ in range(grid_h)] for _ in range(grid_w)
-        ]
-
-        for y in range(height):
-            for x in range(width):
-                cell = self.maze.grid[y][x]
-                px = 2 * x + 1
-                py = 2 * y + 1
-                wall_grid[px][py] = False
-
-                if not cell.walls["north"]:
-                    wall_grid[px][py - 1] = False
-                if not cell.walls["south"]:
-                    wall_grid[px][py + 1] = False
-                if not cell.walls["west"]:
-                    wall_grid[px - 1][py] = False
-                if not cell.walls["east"]:
-                    wall_grid[px + 1][py] = False
+        rows = self.maze.grid
+
+        wall_grid: List[List[bool]] = []
+        prev_column: List[dict] = []
+        for x in range(width):
+            column = [row[x].walls for row in rows]
+            line = [True] * grid_h
+            if x == 0:
+                line[1::2] = [walls["west"] for walls in column]
+            else:
+                line[1::2] = [
+                    walls["west"] and prev["east"]
+                    for walls, prev in zip(column, prev_column)
+                ]
+            wall_grid.append(line)
+
+            line = [False] * grid_h
+            line[0] = column[0]["north"]
+            line[2:-1:2] = [
+                upper["south"] and lower["north"]
+                for upper, lower in zip(column, column[1:])
+            ]
+            line[-1] = column[-1]["south"]
+            wall_grid.append(line)
+            prev_column = column
+
+        line = [True] * grid_h
+        line[1::2] = [walls["east"] for walls in prev_column]
+        wall_grid.append(line)
 
         return wall_grid, (grid_w, grid_h)
 
@@ -1119,188 +1299,110 @@ class GameController:
         neighbor = self.maze.get_cell(x + dx, y + dy)
         if neighbor:
             neighbor.walls[OPPOSITE_DIRECTION[direction]] = target_state
+        # both sides now agree, so patch the single wall slot instead of rebuilding
+        self._wall_grid[2 * x + 1 + dx][2 * y + 1 + dy] = target_state
         return True
 
-    def _replenish_ally_jump_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_last_jump_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_last_jump_bonus_ts = time.time()
-            return
-        now = time.time()
-        elapsed = now - last_ts
-        interval = 15
-        cap = 4
-        if elapsed >= interval:
-            bonus = int(elapsed // interval)
-            current = max(0, getattr(self.state, "ally_jump_charges", 0))
-            self.state.ally_jump_charges = min(cap, current + bonus)
-            self.state.ally_last_jump_bonus_ts = last_ts + bonus * interval
-
-    def _replenish_freeze_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_freeze_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_freeze_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        if not getattr(self.state, "ally_freeze_initial_bonus_awarded", False):
-            if now - last_ts >= 10:
-                current = max(0, getattr(self.state, "ally_freeze_charges", 0))
-                self.state.ally_freeze_charges = min(3, current + 2)
-                self.state.ally_freeze_initial_bonus_awarded = True
-                self.state.ally_freeze_last_bonus_ts = now
-            return
-        elapsed = now - last_ts
-        if elapsed >= 30:
-            gained = int(elapsed // 30)
-            if gained > 0:
-                current = max(0, getattr(self.state, "ally_freeze_charges", 0))
-                self.state.ally_freeze_charges = min(3, current + gained)
-            self.state.ally_freeze_last_bonus_ts = last_ts + gained * 30
-
-    def _replenish_expand_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_expand_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_expand_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        if not getattr(self.state, "ally_expand_initial_bonus_awarded", False):
-            if now - last_ts >= 10:
-                current = max(0, getattr(self.state, "ally_expand_charges", 0))
-                self.state.ally_expand_charges = min(5, current + 2)
-                self.state.ally_expand_initial_bonus_awarded = True
-                self.state.ally_expand_last_bonus_ts = now
-            return
-        elapsed = now - last_ts
-        if elapsed >= 20:
-            cycles = int(elapsed // 20)
-            if cycles > 0:
-                current = max(0, getattr(self.state, "ally_expand_charges", 0))
-                gained = cycles * 2
-                self.state.ally_expand_charges = min(5, current + gained)
-                self.state.ally_expand_last_bonus_ts = last_ts + cycles * 20
-
-    def _replenish_dissolve_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_dissolve_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_dissolve_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        interval = 15
-        cap = getattr(self.state, "ally_dissolve_max_charges", 2)
-        elapsed = now - last_ts
-        if elapsed >= interval:
-            gained = int(elapsed // interval)
-            current = max(0, getattr(self.state, "ally_dissolve_charges", 1))
-            self.state.ally_dissolve_charges = min(cap, current + gained)
-            self.state.ally_dissolve_last_bonus_ts = last_ts + gained * interval
-
-    def _replenish_blink_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_blink_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_blink_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        interval = 20
-        cap = 2
-        elapsed = now - last_ts
-        if elapsed >= interval:
-            gained = int(elapsed // interval)
-            current = max(0, getattr(self.state, "ally_blink_charges", 1))
-            self.state.ally_blink_charges = min(cap, current + gained)
-            self.state.ally_blink_last_bonus_ts = last_ts + gained * interval
-
-    def _expire_dissolved_nodes(self) -> None:
-        dissolved = getattr(self.state, "dissolved_nodes", {})
-        if not dissolved:
+    def _replenish_dissolve_charges(self, now: float) -> None:
+        state = self.state
+        state.ally_dissolve_charges, state.ally_dissolve_last_bonus_ts = refill_charges(
+            state.ally_dissolve_charges,
+            state.ally_dissolve_last_bonus_ts,
+            now,
+            interval=15,
+            cap=state.ally_dissolve_max_charges,
+        )
+
+    def _replenish_blink_charges(self, now: float) -> None:
+        state = self.state
+        state.ally_blink_charges, state.ally_blink_last_bonus_ts = refill_charges(
+            state.ally_blink_charges, state.ally_blink_last_bonus_ts, now, interval=20, cap=2
+        )
+
+    def _rebuild_dissolve_heap(self) -> None:
+        self._dissolve_heap = [(ts, key) for key, ts in self.state.dissolved_nodes.items()]
+        heapq.heapify(self._dissolve_heap)
+
+    def _expire_dissolved_nodes(self, now: float) -> None:
+        heap = self._dissolve_heap
+        if not heap or heap[0][0] > now:
             return
-        now = time.time()
-        to_delete = [(x, y) for (x, y), ts in dissolved.items() if ts <= now]
-        for key in to_delete:
-            dissolved.pop(key, None)
+        dissolved = self.state.dissolved_nodes
+        active = self.state.active_decisions
+        width = self.maze.width
+        height = self.maze.height
+        while heap and heap[0][0] <= now:
+            ts, key = heapq.heappop(heap)
+            # skip stale entries left behind by a re-dissolve of the same node
+            if dissolved.get(key) != ts:
+                continue
+            del dissolved[key]
             # restore active decision if still valid
-            if 0 <= key[0] < self.maze.width and 0 <= key[1] < self.maze.height:
-                self.state.active_decisions.add(key)
+            if 0 <= key[0] < width and 0 <= key[1] < height:
+                active.add(key)
+
+    def _replenish_lift_charges(self, now: float) -> None:
+        state = self.state
+        (
+            state.ally_lift_charges,
+            state.ally_lift_last_bonus_ts,
+            state.ally_lift_initial_bonus_awarded,
+        ) = refill_charges_after_bonus(
+            state.ally_lift_charges,
+            state.ally_lift_last_bonus_ts,
+            state.ally_lift_initial_bonus_awarded,
+            now,
+            delay=10,
+            bonus=1,
+            interval=20,
+            cap=2,
+        )
 
-    def _replenish_lift_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_lift_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_lift_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        if not getattr(self.state, "ally_lift_initial_bonus_awarded", False):
-            elapsed = now - last_ts
-            if elapsed < 10:
-                return
-            current = max(0, getattr(self.state, "ally_lift_charges", 0))
-            self.state.ally_lift_charges = min(2, current + 1)
-            self.state.ally_lift_initial_bonus_awarded = True
-            self.state.ally_lift_last_bonus_ts = now
-            return
-        elapsed = now - last_ts
-        if elapsed >= 20:
-            gained = int(elapsed // 20)
-            if gained > 0:
-                current = max(0, getattr(self.state, "ally_lift_charges", 0))
-                self.state.ally_lift_charges = min(2, current + gained)
-                self.state.ally_lift_last_bonus_ts = last_ts + gained * 20
-
-    def _replenish_trap_charges(self) -> None:
-        last_ts = getattr(self.state, "ally_trap_last_bonus_ts", None)
-        if last_ts is None:
-            self.state.ally_trap_last_bonus_ts = time.time()
-            return
-        now = time.time()
-        interval = 20
-        cap = 2
-        elapsed = now - last_ts
-        if elapsed >= interval:
-            gained = int(elapsed // interval)
-            current = max(0, getattr(self.state, "ally_trap_charges", 1))
-            self.state.ally_trap_charges = min(cap, current + gained)
-            self.state.ally_trap_last_bonus_ts = last_ts + gained * interval
-
-    def _expire_traps(self) -> None:
-        traps = getattr(self.state, "traps", [])
-        if not traps:
+    def _replenish_trap_charges(self, now: float) -> None:
+        state = self.state
+        state.ally_trap_charges, state.ally_trap_last_bonus_ts = refill_charges(
+            state.ally_trap_charges, state.ally_trap_last_bonus_ts, now, interval=20, cap=2
+        )
+
+    def _rebuild_trap_expiry(self) -> None:
+        self._trap_expiry = [
+            trap["expires_at"] for trap in self.state.traps if trap.get("expires_at")
+        ]
+        heapq.heapify(self._trap_expiry)
+
+    def _expire_traps(self, now: float) -> None:
+        expiry = self._trap_expiry
+        # common case: the earliest expiry is still in the future
+        if not expiry or expiry[0] > now:
             return
-        now = time.time()
+        while expiry and expiry[0] <= now:
+            heapq.heappop(expiry)
         remaining = []
-        for trap in traps:
+        for trap in self.state.traps:
             expires_at = trap.get("expires_at", 0)
             if expires_at and expires_at <= now:
                 continue
             remaining.append(trap)
         self.state.traps = remaining
 
-    def _sync_escape_state(self) -> None:
-        if not hasattr(self.state, "hero_escape_charges"):
-            # give the hero at least one escape by default so they can break free early-game
-            self.state.hero_escape_charges = 1
-        if not hasattr(self.state, "hero_escape_last_age"):
-            self.state.hero_escape_last_age = 0
-        self._grant_escape_by_age()
-
     def _grant_escape_by_age(self) -> None:
-        last_age = getattr(self.state, "hero_escape_last_age", 0)
-        current_age = getattr(self.state, "age", 10)
+        last_age = self.state.hero_escape_last_age
         # grant on each 10-year threshold crossed
-        while current_age >= (last_age + 10):
-            self.state.hero_escape_charges = max(0, getattr(self.state, "hero_escape_charges", 0)) + 1
-            last_age += 10
-        self.state.hero_escape_last_age = last_age
+        crossed = (self.state.age - last_age) // 10
+        if crossed > 0:
+            self.state.hero_escape_charges = max(0, self.state.hero_escape_charges) + crossed
+            self.state.hero_escape_last_age = last_age + crossed * 10
 
     def _grant_shield_bonus_if_needed(self) -> None:
-        last_age = getattr(self.state, "shield_last_age", 0)
-        current_age = getattr(self.state, "age", 10)
+        last_age = self.state.shield_last_age
         # grant on each 20-year threshold crossed, cap at 1
-        while current_age >= (last_age + 20):
-            self.state.shield_charges = min(1, max(0, getattr(self.state, "shield_charges", 0)) + 1)
-            last_age += 20
-        self.state.shield_last_age = last_age
-
-    def _visible_traps_payload(self) -> list[dict]:
-        traps = getattr(self.state, "traps", [])
-        now = time.time()
+        crossed = (self.state.age - last_age) // 20
+        if crossed > 0:
+            self.state.shield_charges = 1
+            self.state.shield_last_age = last_age + crossed * 20
+
+    def _visible_traps_payload(self, now: float) -> list[dict]:
+        traps = self.state.traps
         out = []
         for trap in traps:
             reveal_at = trap.get("reveal_at", 0)
@@ -1325,7 +1427,7 @@ class GameController:
             summary = self.ai_provider.life_summary(
                 age=self.state.age,
                 stage=self.state.stage,
-                value_dimensions=self.state.value_dimensions.model_dump(),
+                value_dimensions=self.state.value_dimensions_dump(),
                 decisions=len(self.state.history),
                 history_tags=self.state.get_history_tags(),
             )
@@ -3,35 +3,138 @@
 显示道德困境题目、选项、输入框，并展示评审结果
 """
 
+import functools
+
 import pygame
 from typing import Optional, Dict
 from ..core.models import Question, Answer, Review
 from ..core.state import Settings
 
 
+# 换行结果按 (字体, 文本, 宽度) 缓存：题目/反馈/输入内容不变时逐帧直接命中
+@functools.lru_cache(maxsize=256)
+def _wrap_words(font: pygame.font.Font, text: str, max_width: int) -> tuple[str, ...]:
+    """按单词换行
+    
+    先按平均字宽估算一行能放下的单词数，再逐词增减微调，
+    避免每追加一个单词就测量一次整行宽度。
+    """
+    words = text.split()
+    lines = []
+    est_chars = max(1, max_width // max(1, font.size("a")[0]))
+    i = 0
+    while i < len(words):
+        # 估算：累计字符数不超过 est_chars 的单词数（至少一个）
+        j = i + 1
+        length = len(words[i])
+        while j < len(words) and length + 1 + len(words[j]) <= est_chars:
+            length += 1 + len(words[j])
+            j += 1
+        # 放得下就继续加词，放不下就回退（至少保留一个词）
+        while j < len(words) and font.size(" ".join(words[i:j + 1]))[0] <= max_width:
+            j += 1
+        while j > i + 1 and font.size(" ".join(words[i:j]))[0] > max_width:
+            j -= 1
+        lines.append(" ".join(words[i:j]))
+        i = j
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_chars(font: pygame.font.Font, text: str, max_width: int) -> tuple[str, ...]:
+    """按字符换行（中文没有空格分词）
+    
+    先按平均字宽估算一行的字符数整段切出，再逐字增减微调边界。
+    """
+    lines = []
+    est_chars = max(1, max_width // max(1, font.size("a")[0]))
+    i = 0
+    n = len(text)
+    while i < n:
+        j = min(n, i + est_chars)
+        # 放得下就继续加字，放不下就回退（至少保留一个字）
+        while j < n and font.size(text[i:j + 1])[0] <= max_width:
+            j += 1
+        while j > i + 1 and font.size(text[i:j])[0] > max_width:
+            j -= 1
+        lines.append(text[i:j])
+        i = j
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=8)
+def _panel_background(panel_size: tuple[int, int], panel_color: tuple) -> pygame.Surface:
+    """合成面板背景：半透明暗化底 + 圆角面板 + 边框
+    
+    返回的 Surface 被多个弹窗共享，只能用来 blit，不要在上面绘制。
+    """
+    # 只在panel区域做半透明暗化，其它迷宫不被完全遮住
+    width, height = panel_size
+    bg = pygame.Surface((width + 32, height + 32), pygame.SRCALPHA)
+    bg.fill((40, 40, 40, 170))
+    panel = pygame.Rect(16, 16, width, height)
+    pygame.draw.rect(bg, panel_color, panel, border_radius=15)
+    pygame.draw.rect(bg, (100, 100, 100), panel, 3, border_radius=15)
+    return bg
+
+
 class Button:
     """简单按钮类"""
     
-    def __init__(self, rect: pygame.Rect, text: str, color: tuple, hover_color: tuple):
+    __slots__ = (
+        "rect",
+        "text",
+        "color",
+        "hover_color",
+        "hovered",
+        "_surf_rect",
+        "_surf_normal",
+        "_surf_hover",
+    )
+    
+    def __init__(
+        self,
+        rect: pygame.Rect,
+        text: str,
+        color: tuple,
+        hover_color: tuple,
+        font: pygame.font.Font,
+    ):
         self.rect = rect
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.hovered = False
+        # 底色 + 边框 + 文字预先合成普通/悬停两张图，逐帧只 blit 一张
+        text_surf = font.render(text, True, (255, 255, 255))
+        text_rect = text_surf.get_rect(center=rect.center)
+        # 文字超出按钮时扩大画布，保持与直接绘制一致
+        self._surf_rect = rect.union(text_rect)
+        self._surf_normal = self._compose(color, text_surf, text_rect)
+        self._surf_hover = self._compose(hover_color, text_surf, text_rect)
+    
+    def _compose(
+        self, color: tuple, text_surf: pygame.Surface, text_rect: pygame.Rect
+    ) -> pygame.Surface:
+        surf = pygame.Surface(self._surf_rect.size, pygame.SRCALPHA)
+        offset = (-self._surf_rect.x, -self._surf_rect.y)
+        body = self.rect.move(offset)
+        pygame.draw.rect(surf, color, body, border_radius=8)
+        pygame.draw.rect(surf, (80, 80, 80), body, 2, border_radius=8)
+        surf.blit(text_surf, text_rect.move(offset))
+        return surf
     
     def update(self, mouse_pos: tuple[int, int]) -> None:
         """更新悬停状态"""
         self.hovered = self.rect.collidepoint(mouse_pos)
     
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+    def blit_item(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """当前状态的 (按钮图, 位置)，供 Surface.blits 批量绘制"""
+        return (self._surf_hover if self.hovered else self._surf_normal), self._surf_rect
+    
+    def draw(self, screen: pygame.Surface) -> None:
         """绘制按钮"""
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
-        pygame.draw.rect(screen, (80, 80, 80), self.rect, 2, border_radius=8)
-        
-        text_surf = font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        screen.blit(*self.blit_item())
     
     def is_clicked(self, mouse_pos: tuple[int, int]) -> bool:
         """检查是否被点击"""
@@ -41,14 +144,48 @@ class Button:
 class InputBox:
     """文本输入框"""
     
+    __slots__ = (
+        "rect",
+        "font",
+        "_font_height",
+        "max_length",
+        "_chars",
+        "_text",
+        "active",
+        "cursor_visible",
+        "cursor_timer",
+        "_cursor_offset",
+        "_lines_dirty",
+        "_line_texts",
+        "_line_surfs",
+        "_placeholder_surf",
+    )
+    
     def __init__(self, rect: pygame.Rect, font: pygame.font.Font, max_length: int = 200):
         self.rect = rect
         self.font = font
+        self._font_height = font.get_height()
         self.max_length = max_length
-        self.text = ""
+        # 输入按字符存放，增删都是 O(1)；拼好的字符串缓存到下次修改
+        self._chars: list[str] = []
+        self._text: Optional[str] = ""
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
+        # 光标横向偏移（末尾 50 个字符的宽度），只在文本变化时重新测量
+        self._cursor_offset = 0
+        # 换行后渲染好的文字行，只在文本变化后的下一次绘制时重建
+        self._lines_dirty = False
+        self._line_texts: list[str] = []
+        self._line_surfs: list[pygame.Surface] = []
+        self._placeholder_surf = font.render("Enter your thoughts here...", True, (150, 150, 150))
+    
+    @property
+    def text(self) -> str:
+        """当前输入的文本"""
+        if self._text is None:
+            self._text = "".join(self._chars)
+        return self._text
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """处理事件"""
@@ -57,11 +194,15 @@ class InputBox:
         
         if event.type == pygame.KEYDOWN and self.active:
             if event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
+                if self._chars:
+                    self._chars.pop()
             elif event.key == pygame.K_RETURN:
-                pass  # Enter 键不处理
-            elif len(self.text) < self.max_length:
-                self.text += event.unicode
+                return  # Enter 键不处理
+            elif len(self._chars) < self.max_length:
+                self._chars.extend(event.unicode)
+            self._text = None
+            self._lines_dirty = True
+            self._cursor_offset = self.font.size(self.text[-50:])[0]
     
     def update(self, dt: int) -> None:
         """更新光标闪烁"""
@@ -81,48 +222,39 @@ class InputBox:
         # 文本
         if self.text:
             # 支持换行的文本渲染
-            lines = self._wrap_text(self.text, self.rect.width - 20)
+            if self._lines_dirty:
+                lines = self._wrap_text(self.text, self.rect.width - 20)[:3]  # 最多显示3行
+                # 打字通常只改动最后一行，内容没变的行沿用已渲染的图
+                old = dict(zip(self._line_texts, self._line_surfs))
+                self._line_surfs = [
+                    old.get(line) or self.font.render(line, True, (40, 40, 40))
+                    for line in lines
+                ]
+                self._line_texts = list(lines)
+                self._lines_dirty = False
             y_offset = self.rect.y + 10
-            for line in lines[:3]:  # 最多显示3行
-                text_surf = self.font.render(line, True, (40, 40, 40))
+            for text_surf in self._line_surfs:
                 screen.blit(text_surf, (self.rect.x + 10, y_offset))
-                y_offset += self.font.get_height() + 2
+                y_offset += self._font_height + 2
         else:
             # 占位符
-            placeholder = self.font.render("Enter your thoughts here...", True, (150, 150, 150))
-            screen.blit(placeholder, (self.rect.x + 10, self.rect.y + 10))
+            screen.blit(self._placeholder_surf, (self.rect.x + 10, self.rect.y + 10))
         
         # 光标
         if self.active and self.cursor_visible:
-            cursor_x = self.rect.x + 10 + self.font.size(self.text[-50:])[0]
+            cursor_x = self.rect.x + 10 + self._cursor_offset
             cursor_y = self.rect.y + 10
             pygame.draw.line(
                 screen,
                 (40, 40, 40),
                 (cursor_x, cursor_y),
-                (cursor_x, cursor_y + self.font.get_height()),
+                (cursor_x, cursor_y + self._font_height),
                 2
             )
     
-    def _wrap_text(self, text: str, max_width: int) -> list[str]:
-        """文本换行"""
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if self.font.size(test_line)[0] <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return lines
+    def _wrap_text(self, text: str, max_width: int) -> tuple[str, ...]:
+        """文本换行（按单词）"""
+        return _wrap_words(self.font, text, max_width)
 
 
 class DecisionOverlay:
@@ -143,6 +275,8 @@ class DecisionOverlay:
         self.font_large = font_large
         self.font_medium = font_medium
         self.font_small = font_small
+        # 字体行高固定，逐行排版时直接用
+        self._fh_medium = font_medium.get_height()
         
         # 状态
         self.selected_option: Optional[int] = None
@@ -157,6 +291,36 @@ class DecisionOverlay:
         panel_y = int(settings.window_height * 0.2)
         self.panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
         
+        self.last_time = pygame.time.get_ticks()
+        # 更新频率不超过目标帧率，循环跑得更快时直接跳过
+        self._update_interval_ms = 1000 // max(1, settings.fps)
+        
+        # 脏标记：弹窗打开时背后的迷宫静止，画面只随弹窗自身状态变化
+        self._dirty = True
+        self._last_frame_state: Optional[tuple] = None
+        
+        # 评审页的文字及其位置，show_review 时排好
+        self._review_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        
+        # 按钮、输入框和题目文字推迟到第一次用到时再构建，
+        # 弹窗刚打开就被关掉时省掉这部分渲染
+        self._built = False
+        
+        # 暗化底 + 面板背景 + 边框一次性合成，逐帧只 blit 一次；
+        # 面板尺寸只取决于窗口大小，各题目的弹窗共用同一份
+        self._bg_origin = (self.panel_rect.x - 16, self.panel_rect.y - 16)
+        self._bg_question = _panel_background(self.panel_rect.size, (250, 245, 240))
+        self._bg_review = _panel_background(self.panel_rect.size, (245, 250, 245))
+    
+    def _build_widgets(self) -> None:
+        """构建按钮、输入框并渲染题目文字（只执行一次）"""
+        if self._built:
+            return
+        self._built = True
+        
+        panel_x, panel_y, panel_width, _ = self.panel_rect
+        question = self.question
+        
         # 选项按钮
         btn_height = 32
         btn_font = self.font_small
@@ -166,7 +330,7 @@ class DecisionOverlay:
             for i, option in enumerate(question.options):
                 rect = pygame.Rect(panel_x+26, button_y, panel_width-52, btn_height)
                 button = Button(
-                    rect, f"{i+1}. {option}",(100,150,200),(120,170,220))
+                    rect, f"{i+1}. {option}",(100,150,200),(120,170,220), btn_font)
                 self.option_buttons.append(button)
                 button_y += btn_height+8
         
@@ -178,40 +342,81 @@ class DecisionOverlay:
         # 提交按钮
         submit_y = input_y + 62
         self.submit_button = Button(
-            pygame.Rect(panel_x + panel_width//2-54, submit_y, 108, 32),"Submit", (70,180,70),(90,200,90))
+            pygame.Rect(panel_x + panel_width//2-54, submit_y, 108, 32),"Submit", (70,180,70),(90,200,90), self.font_medium)
         
         # 关闭按钮缩小，靠右上
         self.close_button = Button(
-            pygame.Rect(panel_x+panel_width-50, panel_y+7, 38, 20),"Close", (180,70,70),(200,90,90))
-        
-        self.last_time = pygame.time.get_ticks()
+            pygame.Rect(panel_x+panel_width-50, panel_y+7, 38, 20),"Close", (180,70,70),(200,90,90), self.font_small)
+        # 逐帧做悬停检测的全部按钮
+        self._all_buttons = (*self.option_buttons, self.submit_button, self.close_button)
+        # (坐标, 各按钮是否命中)，见 _hit_test
+        self._hit_region_cache: Optional[tuple] = None
+        
+        # 静态文字只渲染一次，逐帧直接 blit
+        self._cached_surfs: dict[str, pygame.Surface] = {
+            "title": self.font_large.render("Moral Dilemma", True, (80, 80, 80)),
+            "hint": self.font_small.render(
+                "Choose an option or enter your thoughts", True, (120, 120, 120)
+            ),
+        }
+        self._prompt_surfs = [
+            self.font_medium.render(line, True, (40, 40, 40))
+            for line in self._wrap_text(question.prompt, self.panel_rect.width - 100)
+        ]
+        
+        # 选中高亮框预先画好，按选项下标取用
+        self._highlight_rects = [button.rect.inflate(10, 10) for button in self.option_buttons]
+        self._highlight_surfs = [
+            self._build_highlight(rect.size) for rect in self._highlight_rects
+        ]
     
     def handle_event(self, event: pygame.event.Event) -> None:
-        """处理事件"""
-        if self.showing_review:
-            # 评审页面只处理关闭
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = event.pos
-                if self.close_button.is_clicked(mouse_pos):
-                    # 触发关闭
-                    pass
-            return
-        
-        # 输入框事件
-        self.input_box.handle_event(event)
-        
-        # 鼠标点击
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = event.pos
+        """处理单个事件"""
+        self.handle_events((event,))
+    
+    def handle_events(self, events) -> None:
+        """批量处理一帧内的事件"""
+        self._build_widgets()
+        input_box = self.input_box
+        for event in events:
+            event_type = event.type
+            if event_type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 窗口内容可能已丢失，需要整帧重绘
+                self._dirty = True
+            
+            # 评审页面只处理关闭（由 update 检测关闭按钮）
+            if self.showing_review:
+                continue
             
-            # 选项按钮
-            for i, button in enumerate(self.option_buttons):
-                if button.is_clicked(mouse_pos):
-                    self.selected_option = i
+            # 输入框事件
+            input_box.handle_event(event)
             
-            # 提交按钮
-            if self.submit_button.is_clicked(mouse_pos):
-                self.pending_submit = True
+            # 鼠标点击
+            if event_type == pygame.MOUSEBUTTONDOWN:
+                hits = self._hit_test(event.pos)
+                option_count = len(self.option_buttons)
+                
+                # 选项按钮
+                for i in range(option_count):
+                    if hits[i]:
+                        self.selected_option = i
+                
+                # 提交按钮
+                if hits[option_count]:
+                    self.pending_submit = True
+    
+    def _hit_test(self, pos: tuple[int, int]) -> tuple[bool, ...]:
+        """返回 _all_buttons 中各按钮是否位于 pos 下
+        
+        按钮位置固定，同一坐标的结果缓存下来，点击事件和随后的
+        悬停检测通常落在同一点上，不必重复测试。
+        """
+        pos = tuple(pos)
+        if self._hit_region_cache is not None and self._hit_region_cache[0] == pos:
+            return self._hit_region_cache[1]
+        hits = tuple(bool(button.rect.collidepoint(pos)) for button in self._all_buttons)
+        self._hit_region_cache = (pos, hits)
+        return hits
     
     def update(self) -> Optional[Dict]:
         """更新状态
@@ -220,181 +425,166 @@ class DecisionOverlay:
             {"action": "submit", "answer": Answer} 或
             {"action": "close"} 或 None
         """
+        self._build_widgets()
         current_time = pygame.time.get_ticks()
         dt = current_time - self.last_time
+        if dt < self._update_interval_ms:
+            return None
         self.last_time = current_time
         
         # 更新输入框
         self.input_box.update(dt)
         
-        # 更新按钮悬停状态
+        # 更新按钮悬停状态（鼠标只读一次）
         mouse_pos = pygame.mouse.get_pos()
-        for button in self.option_buttons:
-            button.update(mouse_pos)
-        self.submit_button.update(mouse_pos)
-        self.close_button.update(mouse_pos)
+        hovers = self._hit_test(mouse_pos)
+        for button, hovered in zip(self._all_buttons, hovers):
+            button.hovered = hovered
+        
+        frame_state = (
+            self.selected_option,
+            self.input_box.text,
+            self.input_box.active,
+            self.input_box.cursor_visible,
+            hovers,
+            self.showing_review,
+        )
+        if frame_state != self._last_frame_state:
+            self._last_frame_state = frame_state
+            self._dirty = True
         
         # 检查是否点击关闭
         if self.showing_review:
-            if pygame.mouse.get_pressed()[0] and self.close_button.is_clicked(mouse_pos):
+            if self.close_button.hovered and pygame.mouse.get_pressed()[0]:
                 return {"action": "close"}
         
         return None
     
     def show_review(self, review: Review) -> None:
         """显示评审结果"""
+        self._build_widgets()
         self.review = review
         self.showing_review = True
+        self._dirty = True
+        
+        # 评审内容在显示期间不变，这里一次性渲染并排好版
+        panel = self.panel_rect
+        delta = review.growth_delta
+        color = (50, 180, 50) if delta > 0 else (180, 50, 50) if delta < 0 else (100, 100, 100)
+        
+        # 标题
+        blit_list = [
+            (self.font_large.render("Review Feedback", True, (80, 80, 80)), (panel.x + 50, panel.y + 30))
+        ]
+        
+        # 成长值
+        growth_text = self.font_large.render(f"Growth: {delta:+d}", True, color)
+        blit_list.append((growth_text, (panel.centerx - growth_text.get_width() // 2, panel.y + 120)))
+        
+        # 匹配分数
+        score_text = self.font_medium.render(
+            f"Reflection Depth: {review.match_score:.0%}", True, (80, 80, 80)
+        )
+        blit_list.append((score_text, (panel.centerx - score_text.get_width() // 2, panel.y + 180)))
+        
+        # 反馈文本
+        y_offset = panel.y + 240
+        for line in self._wrap_text(review.feedback, panel.width - 100):
+            text_surf = self.font_medium.render(line, True, (60, 60, 60))
+            blit_list.append((text_surf, (panel.centerx - text_surf.get_width() // 2, y_offset)))
+            y_offset += self._fh_medium + 5
+        
+        # 提示
+        hint = self.font_small.render(
+            "Click Close or press ESC to continue exploring", True, (120, 120, 120)
+        )
+        blit_list.append((hint, (panel.centerx - hint.get_width() // 2, panel.bottom - 40)))
+        self._review_blits = blit_list
     
     def _submit_answer(self) -> None:
         """提交答案（内部方法）"""
         # 此方法不再直接返回，而是通过外部调用 show_review
         pass
     
+    @staticmethod
+    def _build_highlight(size: tuple[int, int]) -> pygame.Surface:
+        """选中选项的描边框"""
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255, 220, 100), surf.get_rect(), 3, border_radius=10)
+        return surf
+    
+    @property
+    def needs_redraw(self) -> bool:
+        """自上次 render 以来弹窗画面是否有变化"""
+        return self._dirty and not (self.showing_review and not self.review)
+    
     def render(self) -> None:
-        # 只在panel区域做半透明暗化，其它迷宫不被完全遮住
-        overlay = pygame.Surface((self.settings.window_width, self.settings.window_height), pygame.SRCALPHA)
-        dark_rect = pygame.Surface((self.panel_rect.width+32,self.panel_rect.height+32), pygame.SRCALPHA)
-        dark_rect.fill((40,40,40,170))
-        overlay.blit(dark_rect,(self.panel_rect.x-16,self.panel_rect.y-16))
-        self.screen.blit(overlay, (0,0))
+        # 评审页面还没有评审内容时没有东西可画
+        if self.showing_review and not self.review:
+            return
+        self._build_widgets()
         if self.showing_review:
             self._render_review_card()
         else:
             self._render_question_card()
+        self._dirty = False
     
     def _render_question_card(self) -> None:
-        """渲染题目卡片"""
-        # 面板背景
-        pygame.draw.rect(self.screen, (250, 245, 240), self.panel_rect, border_radius=15)
-        pygame.draw.rect(self.screen, (100, 100, 100), self.panel_rect, 3, border_radius=15)
+        """渲染题目卡片
         
-        # 标题
-        title = self.font_large.render("Moral Dilemma", True, (80, 80, 80))
-        self.screen.blit(title, (self.panel_rect.x + 50, self.panel_rect.y + 30))
+        文字和按钮统一收集后用 Surface.blits 一次提交；输入框需要直接画，
+        所以面板/标题/题目一批，高亮框/按钮/提示一批。
+        """
+        # 面板背景 + 标题
+        blit_list = [
+            (self._bg_question, self._bg_origin),
+            (self._cached_surfs["title"], (self.panel_rect.x + 50, self.panel_rect.y + 30)),
+        ]
         
         # 题目文本（支持换行）
-        prompt_lines = self._wrap_text(self.question.prompt, self.panel_rect.width - 100)
         y_offset = self.panel_rect.y + 80
-        for line in prompt_lines:
-            text_surf = self.font_medium.render(line, True, (40, 40, 40))
-            self.screen.blit(text_surf, (self.panel_rect.x + 50, y_offset))
-            y_offset += self.font_medium.get_height() + 5
-        
-        # 选项按钮
-        for i, button in enumerate(self.option_buttons):
-            # 高亮选中的选项
-            if self.selected_option == i:
-                pygame.draw.rect(
-                    self.screen,
-                    (255, 220, 100),
-                    button.rect.inflate(10, 10),
-                    3,
-                    border_radius=10
-                )
-            button.draw(self.screen, self.font_small)
+        for text_surf in self._prompt_surfs:
+            blit_list.append((text_surf, (self.panel_rect.x + 50, y_offset)))
+            y_offset += self._fh_medium + 5
+        self.screen.blits(blit_list, doreturn=False)
         
         # 输入框
         self.input_box.draw(self.screen)
         
-        # 提交按钮
-        self.submit_button.draw(self.screen, self.font_medium)
+        # 高亮选中的选项（描边在按钮外侧，不与按钮重叠）
+        blit_list = []
+        if self.selected_option is not None:
+            blit_list.append((
+                self._highlight_surfs[self.selected_option],
+                self._highlight_rects[self.selected_option],
+            ))
+        
+        # 选项按钮 + 提交按钮
+        blit_list.extend(button.blit_item() for button in self.option_buttons)
+        blit_list.append(self.submit_button.blit_item())
         
         # 提示文本
-        hint = self.font_small.render(
-            "Choose an option or enter your thoughts",
-            True,
-            (120, 120, 120)
-        )
-        self.screen.blit(
-            hint,
-            (self.panel_rect.centerx - hint.get_width() // 2, self.panel_rect.bottom - 40)
+        hint = self._cached_surfs["hint"]
+        blit_list.append(
+            (hint, (self.panel_rect.centerx - hint.get_width() // 2, self.panel_rect.bottom - 40))
         )
+        self.screen.blits(blit_list, doreturn=False)
     
     def _render_review_card(self) -> None:
         """渲染评审卡片"""
-        if not self.review:
-            return
-        
-        # 面板背景
-        pygame.draw.rect(self.screen, (245, 250, 245), self.panel_rect, border_radius=15)
-        pygame.draw.rect(self.screen, (100, 100, 100), self.panel_rect, 3, border_radius=15)
-        
-        # 标题
-        title = self.font_large.render("Review Feedback", True, (80, 80, 80))
-        self.screen.blit(title, (self.panel_rect.x + 50, self.panel_rect.y + 30))
-        
-        # 成长值
-        delta = self.review.growth_delta
-        color = (50, 180, 50) if delta > 0 else (180, 50, 50) if delta < 0 else (100, 100, 100)
-        growth_text = self.font_large.render(
-            f"Growth: {delta:+d}",
-            True,
-            color
-        )
-        self.screen.blit(
-            growth_text,
-            (self.panel_rect.centerx - growth_text.get_width() // 2, self.panel_rect.y + 120)
-        )
-        
-        # 匹配分数
-        score_text = self.font_medium.render(
-            f"Reflection Depth: {self.review.match_score:.0%}",
-            True,
-            (80, 80, 80)
-        )
-        self.screen.blit(
-            score_text,
-            (self.panel_rect.centerx - score_text.get_width() // 2, self.panel_rect.y + 180)
-        )
-        
-        # 反馈文本
-        feedback_lines = self._wrap_text(self.review.feedback, self.panel_rect.width - 100)
-        y_offset = self.panel_rect.y + 240
-        for line in feedback_lines:
-            text_surf = self.font_medium.render(line, True, (60, 60, 60))
-            self.screen.blit(
-                text_surf,
-                (self.panel_rect.centerx - text_surf.get_width() // 2, y_offset)
-            )
-            y_offset += self.font_medium.get_height() + 5
-        
-        # 关闭按钮
-        self.close_button.draw(self.screen, self.font_small)
-        
-        # 提示
-        hint = self.font_small.render(
-            "Click Close or press ESC to continue exploring",
-            True,
-            (120, 120, 120)
-        )
-        self.screen.blit(
-            hint,
-            (self.panel_rect.centerx - hint.get_width() // 2, self.panel_rect.bottom - 40)
+        # 面板背景 + 关闭按钮 + 排好版的评审文字
+        self.screen.blits(
+            [(self._bg_review, self._bg_origin), self.close_button.blit_item(), *self._review_blits],
+            doreturn=False,
         )
     
-    def _wrap_text(self, text: str, max_width: int) -> list[str]:
-        """文本换行"""
-        words = list(text)  # 中文按字符分
-        lines = []
-        current_line = ""
-        
-        for char in words:
-            test_line = current_line + char
-            if self.font_medium.size(test_line)[0] <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = char
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return lines
+    def _wrap_text(self, text: str, max_width: int) -> tuple[str, ...]:
+        """文本换行（中文按字符分）"""
+        return _wrap_chars(self.font_medium, text, max_width)
     
     def get_answer(self) -> Answer:
         """获取玩家答案"""
+        self._build_widgets()
         return Answer(
             choice_id=self.selected_option,
             free_text=self.input_box.text if self.input_box.text else None
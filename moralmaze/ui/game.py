@@ -3,6 +3,7 @@
 Pygame 主循环，处理迷宫渲染、玩家移动、事件触发
 """
 
+import os
 import pygame
 import sys
 from typing import Optional, Tuple
@@ -11,11 +12,34 @@ from ..core.maze import Maze, Cell
 from ..core.models import Question, Answer, Review, DecisionRecord
 from ..ai.provider_base import AIProvider
 from ..core import save
+from . import image_cache
 from .decision_overlay import DecisionOverlay
 from .timeline import TimelinePage
 import math
 
 
+# 脉动光晕一个周期内预先合成的帧数
+GLOW_FRAMES = 32
+# 迷宫缓存图里表示“透明”的颜色
+MAZE_COLORKEY = (255, 0, 255)
+# 格子四面墙在 _wall_bits 里对应的位
+WALL_NORTH = 1
+WALL_SOUTH = 2
+WALL_WEST = 4
+WALL_EAST = 8
+# 玩家朝向编号 -> 名称 / 颜色
+DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = 0, 1, 2, 3
+PLAYER_DIRS = ("up", "down", "left", "right")
+PLAYER_COLORS = ((60,140,255), (240,72,90), (120,210,88), (120,80,210))
+# 成长值正负号（-1/0/1）-> HUD 颜色
+GROWTH_COLORS = {1: (50, 180, 50), -1: (180, 50, 50), 0: (100, 100, 100)}
+# 移动用的方向键
+MOVE_KEYS = frozenset((
+    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+    pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,
+))
+
+
 class MazeGame:
     """迷宫游戏主类"""
     
@@ -45,6 +69,19 @@ class MazeGame:
             (settings.window_width, settings.window_height)
         )
         pygame.display.set_caption(settings.title)
+        # 只让用得到的事件进队列，鼠标移动等高频事件直接丢弃
+        # （悬停用 mouse.get_pos，移动用 key.get_pressed，不依赖事件）
+        # TEXTINPUT 要保留，KEYDOWN 的 unicode 由它填充；KEYUP 用来跟踪方向键
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.TEXTINPUT,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.VIDEOEXPOSE,
+            pygame.WINDOWEXPOSED,
+        ])
         self.clock = pygame.time.Clock()
         
         # 字体
@@ -56,6 +93,19 @@ class MazeGame:
         self.player_x, self.player_y = maze.start_pos
         self.state.current_position = (self.player_x, self.player_y)
         
+        # 决策节点坐标，及其中尚未访问过的（只有这些要画脉动点）
+        self._decision_coords = {
+            (x, y)
+            for y, row in enumerate(maze.grid)
+            for x, cell in enumerate(row)
+            if cell.decision_node
+        }
+        self._unvisited_coords = self._decision_coords - self.state.visited_nodes
+        # 各节点光晕相位的固定部分（mx*1.3），预先换算成光晕帧下标的偏移
+        self._glow_offsets = {
+            (x, y): x*1.3 / math.tau * GLOW_FRAMES for x, y in self._decision_coords
+        }
+        
         # 计算迷宫渲染参数
         # 摄像机窗口大小，单位：tile（推荐奇数最大贴边）
         self.camera_tiles_w = min(15, self.maze.width) if self.maze.width>9 else self.maze.width
@@ -66,54 +116,119 @@ class MazeGame:
         cell_size_x = (settings.window_width)//self.camera_tiles_w
         cell_size_y = (settings.window_height)//self.camera_tiles_h
         self.cell_size = min(cell_size_x, cell_size_y)
+        # 通过cell_size算出镜头像素宽高
+        self.camera_pixel_w = self.camera_tiles_w * self.cell_size
+        self.camera_pixel_h = self.camera_tiles_h * self.cell_size
         # 补偿offset，使屏幕正中心严格对应tile正中心
         self.center_px = settings.window_width//2
         self.center_py = settings.window_height//2
         
-        # UI 状态
+        # 镜头内第 y 行第 x 列格子的屏幕区域
+        origin_x = self.center_px - self.half_camera_w*self.cell_size
+        origin_y = self.center_py - self.half_camera_h*self.cell_size
+        self._tile_rects = [
+            [pygame.Rect(origin_x + x*self.cell_size, origin_y + y*self.cell_size, self.cell_size, self.cell_size)
+             for x in range(self.camera_tiles_w)]
+            for y in range(self.camera_tiles_h)
+        ]
+        
+        # 地板和四个方向的墙预先做成小图，render_maze 逐帧只做批量 blit
+        # 墙厚 5 像素，与以线宽 5 画在格子边缘上的像素范围一致
+        cs = self.cell_size
+        self._floor_surf = pygame.Surface((cs, cs)).convert()
+        self._floor_surf.fill((225,225,229))
+        self._wall_h = pygame.Surface((cs, 5)).convert()
+        self._wall_h.fill((80,80,120))
+        self._wall_v = pygame.Surface((5, cs)).convert()
+        self._wall_v.fill((80,80,120))
+        # 墙位 -> (墙图, 相对格子左上角的偏移)
+        self._wall_blits = (
+            (WALL_NORTH, self._wall_h, (0, -2)),
+            (WALL_SOUTH, self._wall_h, (0, cs - 3)),
+            (WALL_WEST, self._wall_v, (-2, 0)),
+            (WALL_EAST, self._wall_v, (cs - 3, 0)),
+        )
+        # 每个格子的四面墙压成一个整数，_wall_bits[y][x]（游戏中迷宫不变）
+        self._wall_bits = [
+            bytes(
+                (WALL_NORTH if cell.walls["north"] else 0)
+                | (WALL_SOUTH if cell.walls["south"] else 0)
+                | (WALL_WEST if cell.walls["west"] else 0)
+                | (WALL_EAST if cell.walls["east"] else 0)
+                for cell in row
+            )
+            for row in maze.grid
+        ]
+        # 整个迷宫的地板+墙图层和仅墙图层，开局画一次，镜头移动只换取图区域
+        self._maze_surf, self._maze_wall_surf = self._build_maze_layers()
+        # (镜头位置, 该位置的静态迷宫 blit 列表)，见 _camera_blits
+        self._camera_view: Optional[tuple] = None
+        # 事件节点的脉动光晕按相位预先合成 GLOW_FRAMES 帧，逐帧每个节点只叠加一次
+        self._glow_frames = self._build_glow_frames(cs)
+        # 主角脚下的阴影固定不变，画一次后逐帧直接 blit
+        self._shadow_surf = pygame.Surface((cs, cs//2), pygame.SRCALPHA)
+        pygame.draw.ellipse(self._shadow_surf, (60,60,70,120), (0,0,cs,cs//2))
+        
+        # UI 状态；弹窗、时间线、暂停变化时通过属性 setter 切换当前的事件/更新处理函数
         self.running = True
-        self.paused = False
-        self.decision_overlay: Optional[DecisionOverlay] = None
-        self.timeline_page: Optional[TimelinePage] = None
+        self._paused = False
+        self._decision_overlay: Optional[DecisionOverlay] = None
+        self._timeline_page: Optional[TimelinePage] = None
+        self._select_handlers()
+        # 本帧要交给决策弹窗的事件，见 handle_events
+        self._overlay_events: list[pygame.event.Event] = []
         self.current_question: Optional[Question] = None
         self.last_review: Optional[Review] = None
         
+        # 当前按住的方向键，没有按键时 handle_movement 直接返回
+        self._keys_down: set[int] = set()
+        
         # 移动冷却
         self.move_cooldown = 0
         self.move_delay = 150  # 毫秒
         
-        # 摄像头可视大小（保证奇数居中）
-        self.camera_tile_w = min(17, maze.width) if maze.width > 9 else maze.width  # 画面宽度tile数
-        self.camera_tile_h = min(13, maze.height) if maze.height > 7 else maze.height
-        # 通过cell_size算出像素宽高（可继续适配屏幕）
-        self.camera_pixel_w = self.camera_tile_w * self.cell_size
-        self.camera_pixel_h = self.camera_tile_h * self.cell_size
-        
-        # 加载地板与墙壁贴图
+        # 加载地板与墙壁贴图，缺图时用纯色块代替，绘制时不必判断
         try:
-            self.img_tile_floor = pygame.image.load("moralmaze/ui/assets/tile_floor.png").convert_alpha()
-        except:
-            self.img_tile_floor = None
+            self.img_tile_floor = image_cache.load("moralmaze/ui/assets/tile_floor.png")
+        except FileNotFoundError:
+            self.img_tile_floor = self._floor_surf
         try:
-            self.img_tile_wall = pygame.image.load("moralmaze/ui/assets/tile_wall.png").convert_alpha()
-        except:
-            self.img_tile_wall = None
+            self.img_tile_wall = image_cache.load("moralmaze/ui/assets/tile_wall.png")
+        except FileNotFoundError:
+            self.img_tile_wall = pygame.Surface((self.cell_size, self.cell_size)).convert()
+            self.img_tile_wall.fill((80,80,120))
         # 主角四方向多帧动画
         self.player_sprites = {}
         dirs = ["down","left","right","up"]
         for d in dirs:
             arr=[]
             for i in range(4):
-                try:
-                    arr.append(pygame.image.load(f"moralmaze/ui/assets/player_{d}_{i}.png").convert_alpha())
-                except:
+                path = f"moralmaze/ui/assets/player_{d}_{i}.png"
+                if not os.path.exists(path):
                     break
+                arr.append(image_cache.load(path))
             self.player_sprites[d]=arr if arr else None
+        # 按 朝向编号*4+帧 平铺，缺帧为 None
+        self._psprites = tuple(
+            arr[i] if arr and i < len(arr) else None
+            for arr in (self.player_sprites[d] for d in PLAYER_DIRS)
+            for i in range(4)
+        )
         # 玩家朝向与帧计数
-        self.player_dir = "down"
+        self.player_dir_id = DIR_DOWN
         self.player_anim_frame = 0
         self.player_anim_tick = 0
         self.node_anim_tick = 0 # 用于节点发光
+        # HUD 文字只在内容变化时重新渲染：(文字, 颜色, 字体) -> Surface
+        self._hud_cache: dict[tuple, pygame.Surface] = {}
+        # 最近成长值 -> (渲染好的文字, 右上角位置)
+        self._growth_cache: dict[int, tuple] = {}
+        # 本帧/上一帧画面会变化的区域（玩家、光晕、HUD），镜头不动时只提交这些区域
+        self._dirty_rects: list[pygame.Rect] = []
+        self._prev_dirty_rects: list[pygame.Rect] = []
+        self._last_view: Optional[tuple] = None
+        # 上一次画纯迷宫画面时的 _frame_signature
+        self._last_frame_sig: Optional[tuple] = None
     
     def run(self) -> None:
         """运行游戏主循环"""
@@ -142,33 +257,106 @@ class MazeGame:
         
         pygame.quit()
     
+    @property
+    def player_dir(self) -> str:
+        """玩家朝向名称（up/down/left/right）"""
+        return PLAYER_DIRS[self.player_dir_id]
+    
+    @property
+    def decision_overlay(self) -> Optional[DecisionOverlay]:
+        return self._decision_overlay
+    
+    @decision_overlay.setter
+    def decision_overlay(self, overlay: Optional[DecisionOverlay]) -> None:
+        self._decision_overlay = overlay
+        self._select_handlers()
+    
+    @property
+    def timeline_page(self) -> Optional[TimelinePage]:
+        return self._timeline_page
+    
+    @timeline_page.setter
+    def timeline_page(self, page: Optional[TimelinePage]) -> None:
+        self._timeline_page = page
+        self._select_handlers()
+    
+    @property
+    def paused(self) -> bool:
+        return self._paused
+    
+    @paused.setter
+    def paused(self, paused: bool) -> None:
+        self._paused = paused
+        self._select_handlers()
+    
+    def _select_handlers(self) -> None:
+        """按当前界面状态选定事件和更新处理函数（决策弹窗 > 时间线 > 暂停 > 游戏中）"""
+        if self._decision_overlay:
+            self._event_handler = self._handle_decision_event
+            self._update_handler = self._update_decision
+        elif self._timeline_page:
+            self._event_handler = self._handle_timeline_event
+            self._update_handler = self._update_idle
+        elif self._paused:
+            self._event_handler = self._handle_playing_event
+            self._update_handler = self._update_idle
+        else:
+            self._event_handler = self._handle_playing_event
+            self._update_handler = self._update_playing
+    
     def handle_events(self) -> None:
         """处理事件"""
+        # 发给决策弹窗的事件攒成一批，循环结束后一次性交给弹窗
+        self._overlay_events = []
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.decision_overlay:
-                        # 关闭决策弹窗
-                        self.decision_overlay = None
-                    elif self.timeline_page:
-                        # 关闭时间线
-                        self.timeline_page = None
-                    else:
-                        # 暂停/保存/退出
-                        self.paused = not self.paused
-                        if self.paused:
-                            save.save_now(self.state, self.settings.save_path)
-            
-            # 将事件传递给活动的覆盖层
-            if self.decision_overlay:
-                self.decision_overlay.handle_event(event)
-            elif self.timeline_page:
-                result = self.timeline_page.handle_event(event)
-                if result == "restart":
-                    self.running = False  # 触发重启
+            self._event_handler(event)
+        
+        # 弹窗若已被 ESC 关闭，攒下的事件随之丢弃
+        if self._overlay_events and self.decision_overlay:
+            self.decision_overlay.handle_events(self._overlay_events)
+    
+    def _handle_common_event(self, event: pygame.event.Event) -> bool:
+        """各状态共用的事件处理，返回是否按下了 ESC"""
+        event_type = event.type
+        if event_type == pygame.QUIT:
+            self.running = False
+        elif event_type == pygame.KEYUP:
+            self._keys_down.discard(event.key)
+        elif event_type == pygame.KEYDOWN:
+            if event.key in MOVE_KEYS:
+                self._keys_down.add(event.key)
+            return event.key == pygame.K_ESCAPE
+        elif event_type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # 窗口内容可能已丢失：下一帧跳过画面比较，并整窗 flip
+            self._last_frame_sig = None
+            self._last_view = None
+        return False
+    
+    def _handle_playing_event(self, event: pygame.event.Event) -> None:
+        """游戏中 / 暂停时的事件"""
+        if self._handle_common_event(event):
+            # 暂停/保存/退出
+            self.paused = not self.paused
+            if self.paused:
+                save.save_now(self.state, self.settings.save_path)
+    
+    def _handle_decision_event(self, event: pygame.event.Event) -> None:
+        """决策弹窗打开时的事件"""
+        if self._handle_common_event(event):
+            # 关闭决策弹窗
+            self.decision_overlay = None
+            return
+        self._overlay_events.append(event)
+    
+    def _handle_timeline_event(self, event: pygame.event.Event) -> None:
+        """时间线页面的事件"""
+        if self._handle_common_event(event):
+            # 关闭时间线
+            self.timeline_page = None
+            return
+        result = self.timeline_page.handle_event(event)
+        if result == "restart":
+            self.running = False  # 触发重启
     
     def update(self) -> None:
         """更新游戏状态"""
@@ -185,74 +373,74 @@ class MazeGame:
                 )
             return
         
-        # 决策弹窗处理
-        if self.decision_overlay:
-            # 检查是否有待提交的答案
-            if self.decision_overlay.pending_submit:
-                answer = self.decision_overlay.get_answer()
-                self.process_decision(self.current_question, answer)
-                self.decision_overlay.pending_submit = False
-                return
-            
-            result = self.decision_overlay.update()
-            if result:
-                if result["action"] == "close":
-                    # 关闭弹窗
-                    self.decision_overlay = None
-                    self.current_question = None
-            return
-        
-        # 时间线页面处理
-        if self.timeline_page:
-            return
-        
-        # 暂停状态不处理移动
-        if self.paused:
+        self._update_handler()
+    
+    def _update_decision(self) -> None:
+        """决策弹窗处理"""
+        # 检查是否有待提交的答案
+        if self.decision_overlay.pending_submit:
+            answer = self.decision_overlay.get_answer()
+            self.process_decision(self.current_question, answer)
+            self.decision_overlay.pending_submit = False
             return
         
+        result = self.decision_overlay.update()
+        if result:
+            if result["action"] == "close":
+                # 关闭弹窗
+                self.decision_overlay = None
+                self.current_question = None
+    
+    def _update_idle(self) -> None:
+        """时间线页面 / 暂停状态不处理移动"""
+    
+    def _update_playing(self) -> None:
+        """游戏中：玩家移动和动画计数"""
         # 玩家移动
         if self.move_cooldown <= 0:
             self.handle_movement()
         
         # 记录帧动画计数
-        if not self.paused:
-            self.player_anim_tick += 1
-            self.node_anim_tick += 1
+        self.player_anim_tick += 1
+        self.node_anim_tick += 1
     
     def handle_movement(self) -> None:
         """处理玩家移动"""
+        # 没按方向键就不用查键盘和格子
+        if not self._keys_down:
+            return
         keys = pygame.key.get_pressed()
         
-        current_cell = self.maze.get_cell(self.player_x, self.player_y)
-        if not current_cell:
+        if not (0 <= self.player_x < self.maze.width and 0 <= self.player_y < self.maze.height):
             return
+        walls = self._wall_bits[self.player_y][self.player_x]
         
         moved = False
         new_x, new_y = self.player_x, self.player_y
-        dir_temp = self.player_dir
+        dir_temp = self.player_dir_id
         if keys[pygame.K_UP] or keys[pygame.K_w]:
-            dir_temp = "up"
-            if self.maze.can_move(current_cell, "north"):
+            dir_temp = DIR_UP
+            if not walls & WALL_NORTH:
                 new_y -= 1
                 moved = True
         elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            dir_temp = "down"
-            if self.maze.can_move(current_cell, "south"):
+            dir_temp = DIR_DOWN
+            if not walls & WALL_SOUTH:
                 new_y += 1
                 moved = True
         elif keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dir_temp = "left"
-            if self.maze.can_move(current_cell, "west"):
+            dir_temp = DIR_LEFT
+            if not walls & WALL_WEST:
                 new_x -= 1
                 moved = True
         elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dir_temp = "right"
-            if self.maze.can_move(current_cell, "east"):
+            dir_temp = DIR_RIGHT
+            if not walls & WALL_EAST:
                 new_x += 1
                 moved = True
         
         if moved:
-            self.player_dir = dir_temp
+            self.player_dir_id = dir_temp
             # 动画帧切换逻辑(80ms)
             if self.player_anim_tick%5==0:
                 self.player_anim_frame = (self.player_anim_frame+1)%4
@@ -272,6 +460,7 @@ class MazeGame:
         
         # 检查是否首次访问
         is_first_visit = self.state.mark_node_visited(self.player_x, self.player_y)
+        self._unvisited_coords.discard((self.player_x, self.player_y))
         if not is_first_visit:
             return
         
@@ -346,6 +535,21 @@ class MazeGame:
 
     def render(self) -> None:
         """渲染游戏画面"""
+        # 决策弹窗打开时迷宫静止，弹窗无变化就沿用上一帧
+        if self.decision_overlay and not self.decision_overlay.needs_redraw:
+            return
+        # 只有迷宫画面时，画面内容不变（玩家没动、动画没走到下一帧、HUD 没变）
+        # 也沿用上一帧；时间线页面跟随鼠标悬停，每帧都画
+        if self.decision_overlay or self.timeline_page:
+            self._last_frame_sig = None
+        else:
+            frame_sig = self._frame_signature()
+            if frame_sig == self._last_frame_sig:
+                return
+            self._last_frame_sig = frame_sig
+        
+        self._dirty_rects = []
+        
         # 背景
         self.screen.fill(self.settings.color_background)
         
@@ -366,83 +570,200 @@ class MazeGame:
         elif self.paused:
             self.render_pause_menu()
         
-        pygame.display.flip()
+        # 有覆盖层、覆盖层刚关闭或镜头移动时整帧提交；否则迷宫静止，只提交
+        # 本帧和上一帧画过玩家、光晕、HUD 的区域（上一帧的区域可能需要擦除）
+        overlay_open = bool(self.decision_overlay or self.timeline_page or self.paused)
+        view = (self.get_camera_xy(), overlay_open)
+        if overlay_open or view != self._last_view:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_dirty_rects + self._dirty_rects)
+        self._last_view = view
+        self._prev_dirty_rects = self._dirty_rects
+    
+    def _frame_signature(self) -> tuple:
+        """决定迷宫画面内容的全部状态，相同则画出来的画面相同"""
+        review = self.last_review
+        return (
+            self.player_x,
+            self.player_y,
+            self.player_dir_id,
+            self.player_anim_frame,  # 有贴图时决定画哪一帧
+            int(2 * math.sin(self.player_anim_tick/5.0)),  # 玩家抖动，见 render_player
+            int(self.node_anim_tick/15.0 / math.tau * GLOW_FRAMES),  # 光晕动画步
+            len(self._unvisited_coords),
+            self.state.age,
+            self.state.stage,
+            review.growth_delta if review else None,
+            self.paused,
+        )
+    
+    def _text(self, text: str, color: tuple, font: pygame.font.Font) -> pygame.Surface:
+        """渲染 HUD 文字，相同内容复用上次的结果"""
+        key = (text, color, font)
+        surf = self._hud_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color).convert_alpha()
+            self._hud_cache[key] = surf
+        return surf
     
     def render_hud(self) -> None:
         from ..core.rules import get_stage_name_en
         # 缩小为极小的角落信息
         hud_font = self.font_small
         # 年龄 阶段放左上
-        age_text = hud_font.render(f"Age:{self.state.age}", True, self.settings.color_text)
-        stage_text = hud_font.render(f"{get_stage_name_en(self.state.stage)}", True, self.settings.color_text)
-        self.screen.blit(age_text, (10, 6))
-        self.screen.blit(stage_text, (10, 22))
+        age_text = self._text(f"Age:{self.state.age}", self.settings.color_text, hud_font)
+        stage_text = self._text(f"{get_stage_name_en(self.state.stage)}", self.settings.color_text, hud_font)
+        dirty = self._dirty_rects
+        dirty.append(self.screen.blit(age_text, (10, 6)))
+        dirty.append(self.screen.blit(stage_text, (10, 22)))
         # 最近成长放右上
         if self.last_review:
             delta = self.last_review.growth_delta
-            color = (50, 180, 50) if delta > 0 else (180, 50, 50) if delta < 0 else (100, 100, 100)
-            growth_text = hud_font.render(f"\u2191{delta:+d}" if delta>0 else f"{delta:+d}", True, color)
-            self.screen.blit(growth_text, (self.settings.window_width - growth_text.get_width() - 18, 6))
+            growth = self._growth_cache.get(delta)
+            if growth is None:
+                color = GROWTH_COLORS[(delta > 0) - (delta < 0)]
+                growth_text = hud_font.render(f"\u2191{delta:+d}" if delta>0 else f"{delta:+d}", True, color).convert_alpha()
+                growth = (growth_text, (self.settings.window_width - growth_text.get_width() - 18, 6))
+                self._growth_cache[delta] = growth
+            dirty.append(self.screen.blit(*growth))
         # AI Provider放左下极角
-        provider_text = hud_font.render(f"AI: {self.ai_provider.name}", True, (120, 120, 120))
-        self.screen.blit(provider_text, (10, self.settings.window_height - 24))
+        provider_text = self._text(f"AI: {self.ai_provider.name}", (120, 120, 120), hud_font)
+        dirty.append(self.screen.blit(provider_text, (10, self.settings.window_height - 24)))
 
     def render_maze(self) -> None:
         # 拿到camera窗口
         cam_x, cam_y = self.get_camera_xy()
+        cell_size = self.cell_size
+        # 地板和墙整块贴上，再叠加脉动点；脉动点原本画在墙下面，
+        # 所以叠加后把该格的墙从仅墙图层再贴一遍
+        blit_seq = list(self._camera_blits(cam_x, cam_y))
+        glow_frames = self._glow_frames
+        glow_offsets = self._glow_offsets
+        glow_base = self.node_anim_tick/15.0 / math.tau * GLOW_FRAMES
+        # ---事件脉动点（只看镜头内未访问的节点）---
+        cam_right = cam_x + self.camera_tiles_w
+        cam_bottom = cam_y + self.camera_tiles_h
+        for mx, my in self._unvisited_coords:
+            if not (cam_x <= mx < cam_right and cam_y <= my < cam_bottom):
+                continue
+            frame = glow_frames[int(glow_base + glow_offsets[mx, my]) % GLOW_FRAMES]
+            cell_rect = self._tile_rects[my - cam_y][mx - cam_x]
+            layer_rect = pygame.Rect(mx*cell_size + 2, my*cell_size + 2, cell_size, cell_size)
+            blit_seq.append((frame, cell_rect, None, pygame.BLEND_RGBA_ADD))
+            blit_seq.append((self._maze_wall_surf, cell_rect, layer_rect))
+            self._dirty_rects.append(cell_rect)
+        self.screen.blits(blit_seq, doreturn=False)
+    
+    def _camera_blits(self, cam_x: int, cam_y: int) -> list:
+        """镜头位置对应的静态迷宫 blit 列表，镜头不动时复用上一次的结果
+        
+        迷宫图层里取镜头范围那一块；镜头边缘格子的外墙会伸出镜头 2 像素，
+        而图层里这 2 像素是相邻格子的内容，所以这部分单独用墙图补上。
+        """
+        key = (cam_x, cam_y)
+        if self._camera_view is not None and self._camera_view[0] == key:
+            return self._camera_view[1]
+        
+        cell_size = self.cell_size
+        wall_bits = self._wall_bits
+        last_x = self.camera_tiles_w - 1
+        last_y = self.camera_tiles_h - 1
+        first_rect = self._tile_rects[0][0]
+        blits = [(
+            self._maze_surf,
+            first_rect,
+            pygame.Rect(
+                cam_x*cell_size + 2, cam_y*cell_size + 2,
+                self.camera_tiles_w*cell_size, self.camera_tiles_h*cell_size,
+            ),
+        )]
+        for x in range(self.camera_tiles_w):
+            top = self._tile_rects[0][x]
+            if wall_bits[cam_y][cam_x + x] & WALL_NORTH:
+                blits.append((self._wall_h, (top.x, top.y - 2), pygame.Rect(0, 0, cell_size, 2)))
+            bottom = self._tile_rects[last_y][x]
+            if wall_bits[cam_y + last_y][cam_x + x] & WALL_SOUTH:
+                blits.append((self._wall_h, bottom.bottomleft, pygame.Rect(0, 3, cell_size, 2)))
         for y in range(self.camera_tiles_h):
-            for x in range(self.camera_tiles_w):
-                mx = cam_x + x
-                my = cam_y + y
-                if mx<0 or mx>=self.maze.width or my<0 or my>=self.maze.height:
-                    continue
-                cell = self.maze.grid[my][mx]
-                px = x*self.cell_size + (self.center_px - self.half_camera_w*self.cell_size)
-                py = y*self.cell_size + (self.center_py - self.half_camera_h*self.cell_size)
-                rect = pygame.Rect(px, py, self.cell_size, self.cell_size)
+            left = self._tile_rects[y][0]
+            if wall_bits[cam_y + y][cam_x] & WALL_WEST:
+                blits.append((self._wall_v, (left.x - 2, left.y), pygame.Rect(0, 0, 2, cell_size)))
+            right = self._tile_rects[y][last_x]
+            if wall_bits[cam_y + y][cam_x + last_x] & WALL_EAST:
+                blits.append((self._wall_v, right.topright, pygame.Rect(3, 0, 2, cell_size)))
+        
+        self._camera_view = (key, blits)
+        return blits
+    
+    def _build_maze_layers(self) -> tuple:
+        """绘制整个迷宫的地板和墙
+        
+        Returns:
+            (地板+墙图层, 仅墙图层)；图层四周留出墙伸出格子的 2 像素，
+            第 (x, y) 格位于 (x*cell_size+2, y*cell_size+2)。仅墙图层以
+            MAZE_COLORKEY 作透明色，地板的位置是透明的
+        """
+        cell_size = self.cell_size
+        size = (self.maze.width*cell_size + 4, self.maze.height*cell_size + 4)
+        maze_surf = pygame.Surface(size).convert()
+        wall_surf = pygame.Surface(size).convert()
+        clear_tile = pygame.Surface((cell_size, cell_size)).convert()
+        for surf in (maze_surf, wall_surf, clear_tile):
+            surf.fill(MAZE_COLORKEY)
+        
+        # 按格子顺序画（地板、墙），后画的格子地板会盖住前一格墙的外沿
+        maze_seq = []
+        wall_seq = []
+        for my, row in enumerate(self._wall_bits):
+            py = my*cell_size + 2
+            for mx, walls in enumerate(row):
+                px = mx*cell_size + 2
                 # ---Floor填充明亮色---
-                pygame.draw.rect(self.screen, (225,225,229), rect)
-                # ---事件脉动点---
-                if cell.decision_node and (mx, my) not in self.state.visited_nodes:
-                    base = 180 + int(35*math.sin(self.node_anim_tick/14.0 + (mx+my)*0.7))
-                    for rad in reversed(range(12, self.cell_size//2, 2)):
-                        alpha = int(38*math.sin(self.node_anim_tick/15.0 + rad + mx*1.3))
-                        surf = pygame.Surface((rad*2, rad*2), pygame.SRCALPHA)
-                        pygame.draw.circle(surf, (255,246,200,93+alpha), (rad,rad), rad)
-                        self.screen.blit(surf, (px+self.cell_size//2-rad, py+self.cell_size//2-rad), special_flags=pygame.BLEND_RGBA_ADD)
+                maze_seq.append((self._floor_surf, (px, py)))
+                wall_seq.append((clear_tile, (px, py)))
                 # ---墙体加粗线---
-                wall = cell.walls
-                thick = 5
-                clr = (80,80,120)
-                # 都要减1像素避免双边重叠
-                if wall["north"]:
-                    pygame.draw.line(self.screen, clr, (px, py), (px + self.cell_size -1, py), thick)
-                if wall["south"]:
-                    pygame.draw.line(self.screen, clr, (px, py + self.cell_size -1), (px + self.cell_size -1, py + self.cell_size -1), thick)
-                if wall["west"]:
-                    pygame.draw.line(self.screen, clr, (px, py), (px, py + self.cell_size -1), thick)
-                if wall["east"]:
-                    pygame.draw.line(self.screen, clr, (px + self.cell_size -1, py), (px + self.cell_size -1, py + self.cell_size -1), thick)
+                for bit, wall_tile, (dx, dy) in self._wall_blits:
+                    if walls & bit:
+                        maze_seq.append((wall_tile, (px + dx, py + dy)))
+                        wall_seq.append((wall_tile, (px + dx, py + dy)))
+        maze_surf.blits(maze_seq, doreturn=False)
+        wall_surf.blits(wall_seq, doreturn=False)
+        wall_surf.set_colorkey(MAZE_COLORKEY)
+        return maze_surf, wall_surf
+    
+    @staticmethod
+    def _build_glow_frames(cell_size: int) -> tuple:
+        """合成一个周期内各相位的节点光晕（同心圆逐层叠加）"""
+        frames = []
+        for t in range(GLOW_FRAMES):
+            phase = t / GLOW_FRAMES * math.tau
+            frame = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+            for rad in reversed(range(12, cell_size//2, 2)):
+                alpha = int(38*math.sin(phase + rad))
+                surf = pygame.Surface((rad*2, rad*2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (255,246,200,93+alpha), (rad,rad), rad)
+                frame.blit(surf, (cell_size//2-rad, cell_size//2-rad), special_flags=pygame.BLEND_RGBA_ADD)
+            frames.append(frame)
+        return tuple(frames)
 
     def render_player(self) -> None:
         # 主角始终绘制在中心
         px = self.center_px
         py = self.center_py
-        color_dir = {
-            "down": (240,72,90),
-            "up": (60,140,255),
-            "left": (120,210,88),
-            "right": (120,80,210)
-        }
-        c = color_dir.get(self.player_dir,'down') if hasattr(self,'player_dir') else (220,200,120)
         jitter = int(2 * math.sin(self.player_anim_tick/5.0))
-        shadow_surf = pygame.Surface((self.cell_size, self.cell_size//2), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf,(60,60,70,120),(0,0,self.cell_size,self.cell_size//2))
-        self.screen.blit(shadow_surf,(px-self.cell_size//2, py+self.cell_size//4))
+        shadow_rect = self.screen.blit(self._shadow_surf,(px-self.cell_size//2, py+self.cell_size//4))
         player_rect = pygame.Rect(px-self.cell_size//2+jitter, py-self.cell_size//2+jitter, self.cell_size, self.cell_size)
-        pygame.draw.rect(self.screen, c, player_rect, border_radius=self.cell_size//4)
-        pygame.draw.circle(self.screen,(255,255,255,160),(px,py-self.cell_size//6),self.cell_size//7)
-        pygame.draw.rect(self.screen, (20,20,40), player_rect, 3, border_radius=self.cell_size//3)
+        sprite = self._psprites[self.player_dir_id*4 + self.player_anim_frame]
+        if sprite is not None:
+            player_rect = self.screen.blit(sprite, player_rect.topleft)
+        else:
+            # 没有贴图时画成按朝向着色的方块
+            c = PLAYER_COLORS[self.player_dir_id]
+            pygame.draw.rect(self.screen, c, player_rect, border_radius=self.cell_size//4)
+            pygame.draw.circle(self.screen,(255,255,255,160),(px,py-self.cell_size//6),self.cell_size//7)
+            pygame.draw.rect(self.screen, (20,20,40), player_rect, 3, border_radius=self.cell_size//3)
+        self._dirty_rects.append(shadow_rect.union(player_rect))
     
     def render_pause_menu(self) -> None:
         """渲染暂停菜单"""
@@ -0,0 +1,23 @@
+"""贴图缓存
+
+同一路径的图片只解码、转换一次，各界面共用同一个 Surface
+"""
+
+import pygame
+
+
+# 路径 -> 已 convert_alpha 的 Surface
+_CACHE: dict[str, pygame.Surface] = {}
+
+
+def load(path: str) -> pygame.Surface:
+    """加载图片（需已创建显示窗口）
+    
+    Raises:
+        FileNotFoundError: 图片不存在
+    """
+    surf = _CACHE.get(path)
+    if surf is None:
+        surf = pygame.image.load(path).convert_alpha()
+        _CACHE[path] = surf
+    return surf
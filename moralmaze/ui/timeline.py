@@ -43,6 +43,12 @@ class TimelinePage:
         
         # 计算内容高度
         self._calculate_content_height()
+        
+        # 可滚动内容整张画好缓存起来，历史记录条数变化时才重画
+        self.content_surface: Optional[pygame.Surface] = None
+        self._content_records = -1
+        # 每条历史记录的文字（含阶段名）只渲染一次，重画内容时直接复用
+        self._record_texts: list[list] = []
     
     def _calculate_content_height(self) -> None:
         """计算内容总高度"""
@@ -77,11 +83,28 @@ class TimelinePage:
     
     def render(self) -> None:
         """渲染页面"""
+        if self._content_records != len(self.state.history):
+            self._rebuild_content()
+        
         # 背景
         self.screen.fill((240, 240, 245))
         
-        # 创建可滚动区域
-        content_surface = pygame.Surface((self.settings.window_width, self.content_height))
+        # 将内容渲染到主屏幕（应用滚动）
+        visible_rect = pygame.Rect(
+            0, self.scroll_offset,
+            self.settings.window_width,
+            self.settings.window_height - 150
+        )
+        self.screen.blit(self.content_surface, (0, 0), visible_rect)
+        
+        # 底部面板（固定，不滚动）
+        self._render_bottom_panel()
+    
+    def _rebuild_content(self) -> None:
+        """绘制整张可滚动内容（标题、总结、历史记录）"""
+        self._calculate_content_height()
+        self._content_records = len(self.state.history)
+        content_surface = pygame.Surface((self.settings.window_width, self.content_height)).convert()
         content_surface.fill((240, 240, 245))
         
         y_offset = 20
@@ -130,21 +153,16 @@ class TimelinePage:
         )
         y_offset += 40
         
-        # 历史记录列表
-        for i, record in enumerate(self.state.history):
+        # 历史记录列表；新追加的记录才需要渲染文字
+        history = self.state.history
+        del self._record_texts[len(history):]
+        for i in range(len(self._record_texts), len(history)):
+            self._record_texts.append(self._render_record_texts(history[i], i + 1))
+        for i, record in enumerate(history):
             y_offset = self._render_record(content_surface, record, i + 1, y_offset)
             y_offset += 20
         
-        # 将内容渲染到主屏幕（应用滚动）
-        visible_rect = pygame.Rect(
-            0, self.scroll_offset,
-            self.settings.window_width,
-            self.settings.window_height - 150
-        )
-        self.screen.blit(content_surface, (0, -self.scroll_offset), visible_rect)
-        
-        # 底部面板（固定，不滚动）
-        self._render_bottom_panel()
+        self.content_surface = content_surface
     
     def _render_record(
         self,
@@ -167,13 +185,24 @@ class TimelinePage:
         pygame.draw.rect(surface, (255, 255, 255), card_rect, border_radius=10)
         pygame.draw.rect(surface, (180, 180, 180), card_rect, 2, border_radius=10)
         
+        surface.blits(
+            [(text, (panel_x + dx, y_offset + dy)) for text, (dx, dy) in self._record_texts[index - 1]],
+            doreturn=False,
+        )
+        
+        return y_offset + panel_height
+    
+    def _render_record_texts(self, record, index: int) -> list:
+        """渲染单条记录的文字，返回 [(Surface, 相对卡片左上角的偏移)]"""
+        texts = []
+        
         # 序号和年龄
         header = self.font_small.render(
             f"#{index} | Age {record.age_at_decision} ({get_stage_name_en(record.stage_at_decision)})",
             True,
             (100, 100, 100)
         )
-        surface.blit(header, (panel_x + 15, y_offset + 10))
+        texts.append((header, (15, 10)))
         
         # 题目（截断）
         question_text = record.question.prompt[:60] + "..." if len(record.question.prompt) > 60 else record.question.prompt
@@ -182,7 +211,7 @@ class TimelinePage:
             True,
             (60, 60, 60)
         )
-        surface.blit(question, (panel_x + 15, y_offset + 35))
+        texts.append((question, (15, 35)))
         
         # 答案
         answer_text = ""
@@ -198,7 +227,7 @@ class TimelinePage:
                 True,
                 (60, 60, 60)
             )
-            surface.blit(answer, (panel_x + 15, y_offset + 60))
+            texts.append((answer, (15, 60)))
         
         # 成长值和反馈
         delta = record.review.growth_delta
@@ -208,9 +237,8 @@ class TimelinePage:
             True,
             color
         )
-        surface.blit(growth, (panel_x + 15, y_offset + 85))
-        
-        return y_offset + panel_height
+        texts.append((growth, (15, 85)))
+        return texts
     
     def _render_bottom_panel(self) -> None:
         """渲染底部面板"""
@@ -3,93 +3,115 @@
 运行 FastAPI 服务，并使用 Astray 前端进行渲染。
 """
 
-import random
+import functools
+import importlib
+import importlib.util
+import os
 import sys
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import uvicorn
 import yaml
-from dotenv import load_dotenv
 
-from moralmaze.ai.provider_gemini import create_gemini_provider
-from moralmaze.ai.provider_groq import create_groq_provider
 from moralmaze.ai.provider_mock import MockProvider
-from moralmaze.ai.provider_ollama import create_ollama_provider
-from moralmaze.ai.provider_openai import create_openai_provider
 from moralmaze.core import save
 from moralmaze.core.maze import generate_maze
 from moralmaze.core.state import GameState, Settings
-from moralmaze.server.api import create_app
-from moralmaze.server.controller import build_controller
 
-# 预加载环境变量（API Key 等）
-load_dotenv()
+try:  # libyaml 的 C 实现，未编译时退回纯 Python 版本
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 项目根目录下的 .env（API Key 等）
+ENV_FILE = Path(__file__).resolve().with_name(".env")
+
+
+def load_env() -> None:
+    """加载 .env 中的环境变量；文件不存在或本进程已加载过时跳过"""
+    if os.environ.get("MORALMAZE_ENV_LOADED"):
+        return
+    if ENV_FILE.is_file():
+        from dotenv import load_dotenv
+
+        load_dotenv(ENV_FILE)
+    os.environ["MORALMAZE_ENV_LOADED"] = "1"
 
 
 def load_config() -> dict:
     """加载配置文件"""
     config_path = Path("config.yaml")
-    if not config_path.exists():
+    try:
+        # 整个文件一次读成 bytes 交给 libyaml：C 解析器直接扫描内存并自行解码 UTF-8，
+        # 不再逐块回调 Python 的 read()
+        data = config_path.read_bytes()
+    except FileNotFoundError:
         print("Warning: config.yaml not found, using default config")
         return {}
 
+    # 解析结果不落盘缓存：文件很小，libyaml 已经解析得很快；而反序列化一个别人可写的缓存文件（pickle）并不安全
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return yaml.load(data, Loader=_YamlLoader)
     except Exception as exc:
         print(f"Warning: Failed to load config ({exc}), using default config")
         return {}
 
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """合并 config.yaml 后的设置；整个进程共用同一个实例"""
+    settings = Settings()
+    config = load_config()
+    if config:
+        settings.load_from_dict(config)
+    return settings
+
+
+# provider 名（小写，Settings 读配置时已规范化）-> (启动提示中的名称, 成功/失败提示中的名称, 模块, 工厂函数)；auto 模式按此顺序尝试
+_PROVIDERS = {
+    "ollama": ("Ollama", "Ollama", "moralmaze.ai.provider_ollama", "create_ollama_provider"),
+    "gemini": ("Google Gemini", "Gemini", "moralmaze.ai.provider_gemini", "create_gemini_provider"),
+    "groq": ("Groq", "Groq", "moralmaze.ai.provider_groq", "create_groq_provider"),
+    "openai": ("OpenAI", "OpenAI", "moralmaze.ai.provider_openai", "create_openai_provider"),
+}
+
+
+def _load_provider_factory(provider_type: str):
+    """导入并返回 provider 的工厂函数"""
+    _, _, module_name, factory_name = _PROVIDERS[provider_type]
+    return getattr(importlib.import_module(module_name), factory_name)
+
+
 def create_ai_provider(settings: Settings):
-    """根据设置创建 AI Provider"""
-    provider_type = settings.ai_provider.lower()
+    """根据设置创建 AI Provider
+
+    各 Provider 模块（及其 SDK）只在被选中时才导入。
+    """
+    provider_type = settings.ai_provider
 
     if provider_type == "mock":
         print("Using Mock Provider (Local Review)")
         return MockProvider()
-    if provider_type == "ollama":
-        print("Trying to use Ollama Provider...")
-        provider = create_ollama_provider()
-        if provider._client:
-            print("[OK] Ollama Provider initialized successfully")
-            return provider
-        print("[!] Ollama Provider failed, falling back to Mock Provider")
-        return MockProvider()
-    if provider_type == "gemini":
-        print("Trying to use Google Gemini Provider...")
-        provider = create_gemini_provider()
-        if provider._client:
-            print("[OK] Gemini Provider initialized successfully")
-            return provider
-        print("[!] Gemini Provider failed, falling back to Mock Provider")
-        return MockProvider()
-    if provider_type == "groq":
-        print("Trying to use Groq Provider...")
-        provider = create_groq_provider()
+    entry = _PROVIDERS.get(provider_type)
+    if entry is not None:
+        label, short_label = entry[0], entry[1]
+        print(f"Trying to use {label} Provider...")
+        provider = _load_provider_factory(provider_type)()
         if getattr(provider, "_client", None):
-            print("[OK] Groq Provider initialized successfully")
+            print(f"[OK] {short_label} Provider initialized successfully")
             return provider
-        print("[!] Groq Provider failed, falling back to Mock Provider")
-        return MockProvider()
-    if provider_type == "openai":
-        print("Trying to use OpenAI Provider...")
-        provider = create_openai_provider()
-        if provider._client:
-            print("[OK] OpenAI Provider initialized successfully")
-            return provider
-        print("[!] OpenAI Provider failed, falling back to Mock Provider")
+        print(f"[!] {short_label} Provider failed, falling back to Mock Provider")
         return MockProvider()
 
     # auto：按顺序尝试本地/云端 Provider
     print("Auto-selecting AI Provider...")
-    for factory in (
-        create_ollama_provider,
-        create_gemini_provider,
-        create_groq_provider,
-        create_openai_provider,
-    ):
+    for name in _PROVIDERS:
+        try:
+            factory = _load_provider_factory(name)
+        except ImportError:
+            continue
         provider = factory()
         if provider._client:
             print(f"[OK] Using {provider.name}")
@@ -99,25 +121,29 @@ def create_ai_provider(settings: Settings):
     return MockProvider()
 
 
+def _open_browser(url: str) -> None:
+    try:
+        webbrowser.open(url)
+    except Exception:
+        pass
+
+
 def main():
     """脚本入口，启动 Web 服务"""
-    print("=" * 60)
-    print("Moral Maze - Web Edition")
-    print("=" * 60)
-    print()
+    # 横幅整块拼好后一次写出
+    rule = "=" * 60
+    sys.stdout.write(f"{rule}\nMoral Maze - Web Edition\n{rule}\n\n")
 
     # 加载配置
     print("Loading configuration...")
-    config = load_config()
-    settings = Settings()
-    if config:
-        settings.load_from_dict(config)
+    load_env()
+    settings = get_settings()
     print("[OK] Configuration loaded")
     print()
 
     # 初始化存档 / 状态
     print("Checking save file...")
-    save_data = save.load_save(settings.save_path) if save.has_save(settings.save_path) else None
+    save_data = save.load_save(settings.save_path)
     if save_data:
         print(f"[OK] Save loaded (Age: {save_data.age}, Decisions: {len(save_data.history)})")
         state = GameState(save_data)
@@ -125,28 +151,37 @@ def main():
     else:
         print("No save found, starting new profile")
         state = GameState()
-        maze_seed = settings.maze_seed or random.randint(1, 999_999)
+        maze_seed = settings.maze_seed or int.from_bytes(os.urandom(3), "little") % 999_999 + 1
         state.seed = maze_seed
         state.age = settings.start_age
     print()
 
-    # 生成迷宫
+    # 生成迷宫（后台线程）的同时初始化 AI Provider（多为网络/子进程探测）
     print(f"Generating maze (seed={maze_seed})...")
-    maze = generate_maze(
-        width=settings.maze_width,
-        height=settings.maze_height,
-        seed=maze_seed,
-    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        maze_future = executor.submit(
+            generate_maze,
+            width=settings.maze_width,
+            height=settings.maze_height,
+            seed=maze_seed,
+        )
+
+        # 构建 AI Provider
+        print("Initializing AI system...")
+        ai_provider = create_ai_provider(settings)
+        print(f"[OK] AI Provider: {ai_provider.name}")
+
+        maze = maze_future.result()
     print(f"[OK] Maze generated ({settings.maze_width}x{settings.maze_height})")
     print()
 
-    # 构建 AI Provider
-    print("Initializing AI system...")
-    ai_provider = create_ai_provider(settings)
-    print(f"[OK] AI Provider: {ai_provider.name}")
-    print()
+    # 构建控制器和 FastAPI 应用；Web 相关模块到这里才导入，启动前出错的路径不必加载
+    import uvicorn
+    from fastapi.responses import JSONResponse, ORJSONResponse
+
+    from moralmaze.server.api import create_app
+    from moralmaze.server.controller import build_controller
 
-    # 构建控制器和 FastAPI 应用
     controller = build_controller(
         settings=settings,
         maze=maze,
@@ -154,39 +189,54 @@ def main():
         ai_provider=ai_provider,
     )
 
-    static_dir = Path(settings.static_root)
-    if not static_dir.exists():
+    static_dir = Path(settings.static_root).resolve()
+    static_exists = static_dir.is_dir()
+    if not static_exists:
         print(f"[!] Static directory not found: {static_dir}")
         print("    请先运行 `web/astray` 构建流程或下载 Astray 资源。")
 
-    app = create_app(controller, static_dir=static_dir if static_dir.exists() else None)
+    app = create_app(
+        controller,
+        static_dir=static_dir if static_exists else None,
+        # 装了 orjson 时直接用它序列化接口返回的 dict
+        default_response_class=ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse,
+    )
 
     url = f"http://{settings.server_host}:{settings.server_port}"
-    print("=" * 60)
-    print(f"Server running at: {url}")
-    print(f"API docs: {url}/docs")
-    if static_dir.exists():
-        print("Open the browser to play the game.")
-    print("=" * 60)
-    print()
-
-    if settings.auto_open_browser and static_dir.exists():
-        try:
-            webbrowser.open(url)
-        except Exception:
-            pass
+    banner = [rule, f"Server running at: {url}", f"API docs: {url}/docs"]
+    if static_exists:
+        banner.append("Open the browser to play the game.")
+    banner += [rule, ""]
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
+
+    if settings.auto_open_browser and static_exists:
+        # 查找/启动浏览器可能较慢，放到后台线程并稍等服务开始监听
+        opener = threading.Timer(0.3, _open_browser, args=(url,))
+        opener.daemon = True
+        opener.start()
 
     config = uvicorn.Config(
         app,
         host=settings.server_host,
         port=settings.server_port,
-        log_level="info",
+        # 每个请求一行的访问日志只在 server.debug 时打开
+        log_level="info" if settings.server_debug else "warning",
+        access_log=settings.server_debug,
+        # 安装了 uvicorn[standard] 时使用 uvloop + httptools，否则交给 uvicorn 自动选择。
+        # loop="uvloop" 时由 uvicorn 自己用 uvloop 创建事件循环，这里不再另行
+        # uvloop.install()/设置全局事件循环策略（新版 Python 中已弃用）
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
     )
     server = uvicorn.Server(config)
     try:
         server.run()
     except KeyboardInterrupt:
         print("\nServer interrupted")
+    finally:
+        # 停掉存档线程，并写出防抖队列中尚未落盘的存档
+        controller.close()
     return 0
 
 
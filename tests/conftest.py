@@ -0,0 +1,30 @@
+"""Shared fixtures."""
+
+import pytest
+
+from moralmaze.ai.provider_mock import MockProvider
+from moralmaze.core.maze import generate_maze
+from moralmaze.core.state import GameState, Settings
+from moralmaze.server.controller import build_controller
+
+
+@pytest.fixture
+def settings(tmp_path):
+    settings = Settings()
+    settings.maze_width = 8
+    settings.maze_height = 6
+    settings.save_path = str(tmp_path / "profile.json")
+    return settings
+
+
+@pytest.fixture
+def controller(settings):
+    maze = generate_maze(width=settings.maze_width, height=settings.maze_height, seed=42)
+    controller = build_controller(
+        settings=settings,
+        maze=maze,
+        state=GameState(),
+        ai_provider=MockProvider(),
+    )
+    yield controller
+    controller.close()
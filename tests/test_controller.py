@@ -0,0 +1,293 @@
+"""GameController expiry heaps, wall grid patching and background saves."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from moralmaze.core import save
+from moralmaze.server import controller as controller_module
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(controller_module.time, "time", clock)
+    return clock
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+# ----------------------------------------------------------------------
+# Expiry heaps
+# ----------------------------------------------------------------------
+def test_trap_expires_after_its_deadline(controller, clock):
+    controller.state.ally_trap_charges = 2
+    controller.place_trap("mine", 1, 1)
+    clock.now += 59
+    controller.get_state_payload()
+    assert len(controller.state.traps) == 1
+    clock.now += 2
+    controller.get_state_payload()
+    assert controller.state.traps == []
+    assert controller._trap_expiry == []
+
+
+def test_replaced_trap_outlives_stale_expiry(controller, clock):
+    controller.state.ally_trap_charges = 2
+    controller.place_trap("mine", 1, 1)
+    clock.now += 30
+    controller.place_trap("medkit", 1, 1)
+    # the first trap's expiry passes, the replacement must survive it
+    clock.now += 40
+    controller.get_state_payload()
+    assert [trap["type"] for trap in controller.state.traps] == ["medkit"]
+    clock.now += 30
+    controller.get_state_payload()
+    assert controller.state.traps == []
+
+
+def test_dissolved_node_restored_after_deadline(controller, clock):
+    node = controller.state.active_decisions.sorted()[0]
+    controller.state.ally_dissolve_charges = 2
+    controller.dissolve_node(*node)
+    assert node not in controller.state.active_decisions
+    clock.now += 14
+    controller.get_state_payload()
+    assert node in controller.state.dissolved_nodes
+    clock.now += 2
+    controller.get_state_payload()
+    assert node not in controller.state.dissolved_nodes
+    assert node in controller.state.active_decisions
+
+
+def test_redissolved_node_skips_stale_heap_entry(controller, clock):
+    node = controller.state.active_decisions.sorted()[0]
+    controller.state.ally_dissolve_charges = 2
+    controller.dissolve_node(*node)
+    clock.now += 10
+    controller.state.active_decisions.add(node)
+    controller.dissolve_node(*node)
+    # past the first restore time, but the second dissolve is still running
+    clock.now += 10
+    controller.get_state_payload()
+    assert controller.state.dissolved_nodes == {node: 1025.0}
+    assert node not in controller.state.active_decisions
+    clock.now += 6
+    controller.get_state_payload()
+    assert controller.state.dissolved_nodes == {}
+    assert node in controller.state.active_decisions
+    assert controller._dissolve_heap == []
+
+
+# ----------------------------------------------------------------------
+# Wall grid
+# ----------------------------------------------------------------------
+def test_wall_mutations_match_full_rebuild(controller):
+    rng = random.Random(7)
+    width = controller.maze.width
+    height = controller.maze.height
+    for _ in range(300):
+        mutation = {
+            "x": rng.randrange(width),
+            "y": rng.randrange(height),
+            "direction": rng.choice(list(controller_module.DIR_TO_DELTA)),
+            "action": rng.choice(("open", "close")),
+        }
+        controller.apply_wall_mutations([mutation])
+        assert controller._wall_grid == controller._build_wall_grid()[0]
+
+
+def test_invalid_wall_mutation_is_ignored(controller):
+    before = [line[:] for line in controller._wall_grid]
+    result = controller.apply_wall_mutations(
+        [{"x": 99, "y": 0, "direction": "north", "action": "open"}]
+    )
+    assert result == {"applied": False}
+    assert controller._wall_grid == before
+
+
+# ----------------------------------------------------------------------
+# Timeline
+# ----------------------------------------------------------------------
+def test_timeline_payload_returns_copies(controller):
+    node = controller.state.active_decisions.sorted()[0]
+    question = controller.start_decision(*node)
+    controller.submit_decision(question_id=question["id"], choice_id=0, free_text=None)
+    payload = controller.get_timeline_payload()
+    payload["records"].clear()
+    payload["growth_history"].append({})
+    again = controller.get_timeline_payload()
+    assert [record["index"] for record in again["records"]] == [1]
+    assert len(again["growth_history"]) == 1
+
+
+# ----------------------------------------------------------------------
+# Saving
+# ----------------------------------------------------------------------
+def test_debounced_save_persists_latest_state(controller, settings):
+    for health in (90, 80, 70):
+        controller.state.hero_health = health
+        controller._mark_dirty()
+    assert _wait_for(
+        lambda: (data := save.load_save(settings.save_path)) is not None
+        and data.hero_health == 70
+    )
+
+
+def test_flush_save_writes_immediately(controller, settings):
+    controller.state.hero_health = 42
+    assert controller.flush_save()
+    assert save.load_save(settings.save_path).hero_health == 42
+
+
+def test_failed_save_is_retried(controller, settings, monkeypatch):
+    monkeypatch.setattr(controller_module, "SAVE_RETRY_SECONDS", 0.05)
+    real_write_save = save.write_save
+    calls = []
+
+    def flaky_write_save(save_data, save_path):
+        calls.append(save_path)
+        if len(calls) == 1:
+            return False
+        return real_write_save(save_data, save_path)
+
+    monkeypatch.setattr(save, "write_save", flaky_write_save)
+    controller.state.hero_health = 33
+    controller._mark_dirty()
+    assert _wait_for(
+        lambda: (data := save.load_save(settings.save_path)) is not None
+        and data.hero_health == 33
+    )
+    assert len(calls) >= 2
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda c: c.get_state_payload(),
+        lambda c: c.escape_hero(),
+        lambda c: c.activate_shield(),
+        lambda c: c.blink_ally(),
+        lambda c: c.restart_game(),
+        lambda c: c.get_timeline_payload(),
+    ],
+    ids=[
+        "get_state_payload",
+        "escape_hero",
+        "activate_shield",
+        "blink_ally",
+        "restart_game",
+        "get_timeline_payload",
+    ],
+)
+def test_mutators_wait_for_save_lock(controller, call):
+    # while the save writer holds the lock, no mutator may touch the state
+    finished = threading.Event()
+
+    def run():
+        call(controller)
+        finished.set()
+
+    with controller._lock:
+        worker = threading.Thread(target=run)
+        worker.start()
+        assert not finished.wait(0.2)
+    worker.join(5)
+    assert finished.is_set()
+
+
+def test_saves_survive_concurrent_mutation(controller, settings):
+    width = controller.maze.width
+    height = controller.maze.height
+    errors = []
+    done = threading.Event()
+
+    def mutate():
+        rng = random.Random(3)
+        try:
+            for i in range(500):
+                coords = [
+                    (rng.randrange(width), rng.randrange(height)) for _ in range(rng.randrange(1, 12))
+                ]
+                controller.set_active_decisions(coords)
+                controller.state.ally_blink_charges = 1
+                controller.blink_ally()
+                controller.get_state_payload()
+                if i % 50 == 0:
+                    controller.flush_save()
+        except Exception as exc:  # pragma: no cover - surfaced by the assert below
+            errors.append(exc)
+        finally:
+            done.set()
+
+    worker = threading.Thread(target=mutate)
+    worker.start()
+    while not done.is_set():
+        controller.flush_save()
+    worker.join()
+    assert errors == []
+
+    assert controller.flush_save()
+    data = save.load_save(settings.save_path)
+    assert sorted(map(tuple, data.active_decisions)) == controller.state.active_decisions.sorted()
+    assert tuple(data.ally_position) == controller.state.ally_position
+    assert controller._save_thread.is_alive()
+
+
+def test_save_writes_outside_state_lock(controller, settings, monkeypatch):
+    real_write_save = save.write_save
+    writing = threading.Event()
+    release = threading.Event()
+
+    def slow_write_save(save_data, save_path):
+        writing.set()
+        release.wait(5)
+        return real_write_save(save_data, save_path)
+
+    monkeypatch.setattr(save, "write_save", slow_write_save)
+    controller.state.hero_health = 55
+    controller._mark_dirty()
+    assert writing.wait(5)
+    # the request path keeps running while the worker is still writing
+    controller.state.hero_health = 44
+    assert controller._lock.acquire(timeout=1)
+    controller._lock.release()
+    release.set()
+    assert _wait_for(
+        lambda: (data := save.load_save(settings.save_path)) is not None
+        and data.hero_health == 55
+    )
+
+
+def test_stale_snapshot_does_not_overwrite_newer_save(controller, settings):
+    with controller._lock:
+        old = controller._take_snapshot()
+    controller.state.hero_health = 12
+    assert controller.flush_save()
+    assert controller._write_snapshot(*old)
+    assert save.load_save(settings.save_path).hero_health == 12
+
+
+def test_close_stops_worker_and_flushes(controller, settings):
+    controller.state.hero_health = 21
+    controller._mark_dirty()
+    assert controller.close()
+    assert not controller._save_thread.is_alive()
+    assert save.load_save(settings.save_path).hero_health == 21
@@ -0,0 +1,54 @@
+"""SortedCoordSet cache invalidation."""
+
+import pytest
+
+from moralmaze.core.state import GameState, SortedCoordSet
+
+
+def _mutations():
+    return [
+        ("add", lambda s: s.add((0, 0))),
+        ("discard", lambda s: s.discard((3, 1))),
+        ("remove", lambda s: s.remove((3, 1))),
+        ("pop", lambda s: s.pop()),
+        ("clear", lambda s: s.clear()),
+        ("update", lambda s: s.update({(5, 5)})),
+        ("difference_update", lambda s: s.difference_update({(3, 1)})),
+        ("intersection_update", lambda s: s.intersection_update({(1, 2)})),
+        ("symmetric_difference_update", lambda s: s.symmetric_difference_update({(1, 2), (4, 4)})),
+        ("ior", lambda s: s.__ior__({(6, 0)})),
+        ("iand", lambda s: s.__iand__({(1, 2)})),
+        ("isub", lambda s: s.__isub__({(1, 2)})),
+        ("ixor", lambda s: s.__ixor__({(1, 2), (7, 7)})),
+    ]
+
+
+@pytest.mark.parametrize("name, mutate", _mutations(), ids=[name for name, _ in _mutations()])
+def test_sorted_cache_invalidated_by_every_mutator(name, mutate):
+    coords = SortedCoordSet({(3, 1), (1, 2), (2, 0)})
+    assert coords.sorted() == [(1, 2), (2, 0), (3, 1)]
+    mutate(coords)
+    assert coords.sorted() == sorted(coords)
+
+
+def test_augmented_assignment_keeps_sorted_set():
+    coords = SortedCoordSet({(2, 2)})
+    coords.sorted()
+    coords |= {(0, 1)}
+    assert isinstance(coords, SortedCoordSet)
+    assert coords.sorted() == [(0, 1), (2, 2)]
+
+
+def test_no_op_mutations_keep_cache():
+    coords = SortedCoordSet({(1, 1)})
+    cached = coords.sorted()
+    coords.add((1, 1))
+    coords.discard((9, 9))
+    assert coords.sorted() is cached
+
+
+def test_state_wraps_plain_sets():
+    state = GameState()
+    state.active_decisions = {(2, 1), (0, 3)}
+    assert isinstance(state.active_decisions, SortedCoordSet)
+    assert state.active_decisions.sorted() == [(0, 3), (2, 1)]